@@ -42,16 +42,16 @@ class AgentFactory:
         """
         try:
             if agent_type not in self._agent_classes:
-                logger.warning(f"Unknown agent type: {agent_type}")
+                logger.warning("Unknown agent type: %s", agent_type)
                 return None
             
             agent_class = self._agent_classes[agent_type]
             agent = agent_class(**kwargs)
-            logger.info(f"Created agent of type {agent_type}")
+            logger.info("Created agent of type %s", agent_type)
             return agent
         
         except Exception as e:
-            logger.error(f"Error creating agent of type {agent_type}: {str(e)}")
+            logger.error("Error creating agent of type %s: %s", agent_type, e)
             return None
     
     def create_agents(self, agent_types: Optional[List[str]] = None, **kwargs) -> Dict[str, Agent]:
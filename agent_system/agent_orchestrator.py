@@ -18,6 +18,11 @@ class AgentOrchestrator:
         self.agents = self.agent_factory.create_agents()
         self.memory = ConversationMemory()
     
+    def close(self) -> None:
+        """Close the clients held by every agent."""
+        for agent in self.agents.values():
+            agent.close()
+    
     def process_query(self, query: str, session_id: str = "default") -> Dict[str, Any]:
         """
         Process a user query by orchestrating agents.
@@ -37,7 +42,7 @@ class AgentOrchestrator:
             query_analysis = self._analyze_query(query)
             
             # Log analysis
-            logger.info(f"Query analysis: {query_analysis}")
+            logger.info("Query analysis: %s", query_analysis)
             
             # Determine primary agent based on intent
             primary_agent_type = self._determine_primary_agent(query_analysis)
@@ -62,7 +67,7 @@ class AgentOrchestrator:
             return response
         
         except Exception as e:
-            logger.error(f"Error processing query: {str(e)}")
+            logger.error("Error processing query: %s", e)
             error_response = {
                 "response": "I'm sorry, I encountered an error while processing your query. Please try again with a more specific question.",
                 "error": str(e)
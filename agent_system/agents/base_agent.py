@@ -24,6 +24,10 @@ class Agent(ABC):
         # Initialize conversation memory
         self.memory = []
     
+    def close(self) -> None:
+        """Close the retrieval pipeline's clients."""
+        self.retrieval_pipeline.close()
+    
     @property
     def agent_type(self) -> str:
         """Get the agent type."""
@@ -101,7 +105,7 @@ class Agent(ABC):
             return documents
         
         except Exception as e:
-            logger.error(f"Error retrieving documents: {str(e)}")
+            logger.error("Error retrieving documents: %s", e)
             return []
     
     def _format_documents_as_context(self, documents: List[Dict[str, Any]]) -> str:
@@ -157,5 +161,5 @@ class Agent(ABC):
             return response
         
         except Exception as e:
-            logger.error(f"Error generating response: {str(e)}")
+            logger.error("Error generating response: %s", e)
             return "I'm sorry, I encountered an error while generating a response. Please try again."
\ No newline at end of file
@@ -50,12 +50,15 @@ class DoorIdentifierAgent(Agent):
             door_info["confidence"] = self._calculate_confidence(door_info)
             
             # Log the identification result
-            logger.info(f"Identified door: category={door_info['door_category']}, type={door_info['door_type']}, confidence={door_info['confidence']}")
+            logger.info(
+                "Identified door: category=%s, type=%s, confidence=%s",
+                door_info['door_category'], door_info['door_type'], door_info['confidence']
+            )
             
             return door_info
         
         except Exception as e:
-            logger.error(f"Error identifying door: {str(e)}")
+            logger.error("Error identifying door: %s", e)
             return {
                 "door_category": "unknown",
                 "door_type": "unknown",
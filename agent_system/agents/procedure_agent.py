@@ -89,7 +89,7 @@ class ProcedureAgent(Agent):
             }
         
         except Exception as e:
-            logger.error(f"Error providing installation procedure: {str(e)}")
+            logger.error("Error providing installation procedure: %s", e)
             return {
                 "procedure": "I'm sorry, I encountered an error while generating the installation procedure. Please try again with a more specific question.",
                 "door_category": kwargs.get("door_category", "unknown"),
@@ -199,7 +199,7 @@ class ProcedureAgent(Agent):
             }
         
         except Exception as e:
-            logger.error(f"Error retrieving specific step: {str(e)}")
+            logger.error("Error retrieving specific step: %s", e)
             return {
                 "found": False,
                 "step_number": step_number,
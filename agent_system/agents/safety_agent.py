@@ -102,7 +102,7 @@ important precautions.
             }
         
         except Exception as e:
-            logger.error(f"Error providing safety guidance: {str(e)}")
+            logger.error("Error providing safety guidance: %s", e)
             return {
                 "safety_guidance": "I'm sorry, I encountered an error while generating safety guidance. Please remember to always wear appropriate personal protective equipment and follow manufacturer instructions when installing doors.",
                 "safety_precautions": [],
@@ -272,7 +272,7 @@ Format your response as a structured list of PPE items. For each item, include:
             }
         
         except Exception as e:
-            logger.error(f"Error retrieving PPE recommendations: {str(e)}")
+            logger.error("Error retrieving PPE recommendations: %s", e)
             return {
                 "ppe_recommendations": "Unable to retrieve PPE recommendations.",
                 "ppe_items": [],
@@ -388,7 +388,7 @@ provide a general door installation safety checklist while acknowledging the lim
             }
         
         except Exception as e:
-            logger.error(f"Error creating safety checklist: {str(e)}")
+            logger.error("Error creating safety checklist: %s", e)
             return {
                 "safety_checklist": "Unable to create safety checklist.",
                 "checklist_items": {},
@@ -92,7 +92,7 @@ class ToolAgent(Agent):
             }
         
         except Exception as e:
-            logger.error(f"Error providing tool recommendations: {str(e)}")
+            logger.error("Error providing tool recommendations: %s", e)
             return {
                 "guidance": "I'm sorry, I encountered an error while generating tool recommendations. Please try again with a more specific question.",
                 "tools": [],
@@ -158,7 +158,7 @@ class ToolAgent(Agent):
             }
         
         except Exception as e:
-            logger.error(f"Error retrieving recommended tools: {str(e)}")
+            logger.error("Error retrieving recommended tools: %s", e)
             return {
                 "tool_list": [],
                 "essential_tools": [],
@@ -219,7 +219,7 @@ class ToolAgent(Agent):
             }
         
         except Exception as e:
-            logger.error(f"Error retrieving component details: {str(e)}")
+            logger.error("Error retrieving component details: %s", e)
             return {
                 "component_name": component_name,
                 "description": f"I'm sorry, I couldn't find specific information about the {component_name}.",
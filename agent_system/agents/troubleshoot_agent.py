@@ -85,7 +85,7 @@ class TroubleshootAgent(Agent):
             }
         
         except Exception as e:
-            logger.error(f"Error providing troubleshooting solution: {str(e)}")
+            logger.error("Error providing troubleshooting solution: %s", e)
             return {
                 "solution": "I'm sorry, I encountered an error while generating a troubleshooting solution. Please try again with a more specific description of the issue.",
                 "issues": [],
@@ -211,7 +211,7 @@ class TroubleshootAgent(Agent):
             }
         
         except Exception as e:
-            logger.error(f"Error retrieving common issues: {str(e)}")
+            logger.error("Error retrieving common issues: %s", e)
             return {
                 "common_issues": [],
                 "raw_response": f"Error retrieving common issues: {str(e)}",
@@ -276,7 +276,7 @@ class TroubleshootAgent(Agent):
             }
         
         except Exception as e:
-            logger.error(f"Error diagnosing issue: {str(e)}")
+            logger.error("Error diagnosing issue: %s", e)
             return {
                 "diagnosis": "Unable to diagnose the issue.",
                 "causes": [],
@@ -11,6 +11,8 @@ import uvicorn
 from ..config.app_config import get_config
 from ..config.logging_config import setup_logging
 from .routers import chat_router, search_router, feedback_router
+from .routers.chat import get_agent_orchestrator
+from .routers.search import get_retrieval_pipeline
 from .middleware.auth import get_current_user
 
 # Set up logging
@@ -38,6 +40,19 @@ app.include_router(chat_router)
 app.include_router(search_router)
 app.include_router(feedback_router)
 
+# Release shared router dependencies on shutdown
+@app.on_event("shutdown")
+async def release_shared_dependencies():
+    """Close the process-wide orchestrator's and retrieval pipeline's clients, then drop them."""
+    for get_dependency in (get_agent_orchestrator, get_retrieval_pipeline):
+        # Only close instances that were built; calling the getter would build one
+        if get_dependency.cache_info().currsize:
+            try:
+                get_dependency().close()
+            except Exception as e:
+                logger.warning("Failed to close %s: %s", get_dependency.__name__, e)
+        get_dependency.cache_clear()
+
 # Request logging middleware
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
@@ -47,9 +62,8 @@ async def log_requests(request: Request, call_next):
     process_time = time.time() - start_time
     
     logger.info(
-        f"Request: {request.method} {request.url.path} "
-        f"- Status: {response.status_code} "
-        f"- Processing time: {process_time:.3f}s"
+        "Request: %s %s - Status: %s - Processing time: %.3fs",
+        request.method, request.url.path, response.status_code, process_time
     )
     
     return response
@@ -58,7 +72,7 @@ async def log_requests(request: Request, call_next):
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """Handle unhandled exceptions."""
-    logger.error(f"Unhandled exception: {str(exc)}", exc_info=True)
+    logger.error("Unhandled exception: %s", exc, exc_info=True)
     
     return JSONResponse(
         status_code=500,
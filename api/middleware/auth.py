@@ -1,7 +1,7 @@
 # door_installation_assistant/api/middleware/auth.py
 import logging
 from typing import Dict, Any, Optional
-from fastapi import Depends, HTTPException, Security, status
+from fastapi import Depends, HTTPException, Request, Security, status
 from fastapi.security import APIKeyHeader
 import time
 import jwt
@@ -19,6 +19,9 @@ JWT_SECRET = "your-secret-key"  # In production, this should be securely stored
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
+# Development API keys
+VALID_API_KEYS = frozenset(["dev-key-1", "dev-key-2", "test-key"])
+
 class AuthMiddleware:
     """Authentication middleware."""
     
@@ -37,8 +40,7 @@ class AuthMiddleware:
         """
         # In a real system, this would validate against a database
         # For development, use a simple check
-        valid_keys = ["dev-key-1", "dev-key-2", "test-key"]
-        return api_key in valid_keys
+        return api_key in VALID_API_KEYS
     
     def create_access_token(self, data: Dict[str, Any]) -> str:
         """
@@ -85,14 +87,22 @@ class AuthMiddleware:
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
+# Shared authenticator used by the dependency below
+_auth = AuthMiddleware()
+
 # Authentication dependency
 async def get_current_user(
+    request: Request,
     api_key: Optional[str] = Security(API_KEY_HEADER)
 ) -> Dict[str, Any]:
     """
     Get current user from API key.
     
+    The resolved user is stored on ``request.state`` so any other dependency
+    handling the same request reuses it instead of authenticating again.
+    
     Args:
+        request: Incoming request.
         api_key: API key from header.
         
     Returns:
@@ -101,31 +111,37 @@ async def get_current_user(
     Raises:
         HTTPException: If authentication fails.
     """
+    user = getattr(request.state, "user", None)
+    if user is not None:
+        return user
+    
     # For development and demo purposes
     # In production, use a more robust authentication system
     
     # Check authentication
     if api_key is None:
         # For testing, allow unauthorized access with limited permissions
-        return {
+        user = {
             "id": "anonymous",
             "role": "guest",
             "permissions": ["read"]
         }
+    else:
+        # Verify API key
+        if not _auth.verify_api_key(api_key):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid API key",
+                headers={"WWW-Authenticate": "APIKey"},
+            )
+        
+        # Return user information
+        # In a real system, this would retrieve user details from a database
+        user = {
+            "id": "api_user_1",
+            "role": "user",
+            "permissions": ["read", "write"]
+        }
     
-    # Verify API key
-    auth = AuthMiddleware()
-    if not auth.verify_api_key(api_key):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid API key",
-            headers={"WWW-Authenticate": "APIKey"},
-        )
-    
-    # Return user information
-    # In a real system, this would retrieve user details from a database
-    return {
-        "id": "api_user_1",
-        "role": "user",
-        "permissions": ["read", "write"]
-    }
\ No newline at end of file
+    request.state.user = user
+    return user
\ No newline at end of file
@@ -1,5 +1,6 @@
 # door_installation_assistant/api/routers/chat.py
 import logging
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Header, BackgroundTasks
 from pydantic import BaseModel, Field
@@ -49,8 +50,15 @@ class HistoryResponse(BaseModel):
     messages: List[Dict[str, Any]] = Field(..., description="Conversation messages")
 
 # Get dependencies
+@lru_cache(maxsize=None)
 def get_agent_orchestrator():
-    """Get agent orchestrator instance."""
+    """
+    Get the shared agent orchestrator instance.
+    
+    The orchestrator owns the retrieval clients and conversation memory, so a
+    single instance is reused across requests instead of being rebuilt (and
+    reconnecting to its backends) on every call.
+    """
     return AgentOrchestrator()
 
 @router.post("/query", response_model=QueryResponse)
@@ -86,7 +94,7 @@ async def process_query(
             kwargs.update(request.metadata)
         
         # Log query
-        logger.info(f"Processing query: {request.query} (session: {session_id})")
+        logger.info("Processing query: %s (session: %s)", request.query, session_id)
         
         # Process query through agent orchestrator
         response = agent_orchestrator.process_query(request.query, session_id, **kwargs)
@@ -107,7 +115,7 @@ async def process_query(
         return query_response
     
     except Exception as e:
-        logger.error(f"Error processing query: {str(e)}")
+        logger.error("Error processing query: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/history", response_model=HistoryResponse)
@@ -130,7 +138,7 @@ async def get_conversation_history(
     try:
         # Check if user has access to the session
         if not session_id.startswith(f"session_{user['id']}"):
-            logger.warning(f"User {user['id']} attempted to access unauthorized session {session_id}")
+            logger.warning("User %s attempted to access unauthorized session %s", user['id'], session_id)
             raise HTTPException(status_code=403, detail="You don't have access to this conversation")
         
         # Get conversation history
@@ -144,7 +152,7 @@ async def get_conversation_history(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting conversation history: {str(e)}")
+        logger.error("Error getting conversation history: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.delete("/history")
@@ -167,7 +175,7 @@ async def clear_conversation_history(
     try:
         # Check if user has access to the session
         if not request.session_id.startswith(f"session_{user['id']}"):
-            logger.warning(f"User {user['id']} attempted to access unauthorized session {request.session_id}")
+            logger.warning("User %s attempted to access unauthorized session %s", user['id'], request.session_id)
             raise HTTPException(status_code=403, detail="You don't have access to this conversation")
         
         # Clear conversation history
@@ -178,7 +186,7 @@ async def clear_conversation_history(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error clearing conversation history: {str(e)}")
+        logger.error("Error clearing conversation history: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/stream")
@@ -234,5 +242,5 @@ async def stream_query(
         }
     
     except Exception as e:
-        logger.error(f"Error streaming query: {str(e)}")
+        logger.error("Error streaming query: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
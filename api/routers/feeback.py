@@ -1,4 +1,5 @@
 # door_installation_assistant/api/routers/feedback.py
+import asyncio
 import logging
 from typing import Dict, Any, List, Optional
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
@@ -33,12 +34,16 @@ class FeedbackResponse(BaseModel):
     status: str = Field(..., description="Status")
     created_at: int = Field(..., description="Timestamp")
 
+# Maximum number of background evaluations allowed to call the LLM at once
+MAX_CONCURRENT_EVALUATIONS = 16
+_evaluation_semaphore = asyncio.Semaphore(MAX_CONCURRENT_EVALUATIONS)
+
 # Get dependencies
 def get_evaluator():
     """Get evaluator instance."""
     return Evaluator()
 
-def process_feedback_async(
+async def process_feedback_async(
     feedback_id: str,
     feedback: FeedbackRequest,
     evaluator: Evaluator
@@ -46,6 +51,9 @@ def process_feedback_async(
     """
     Process feedback asynchronously.
     
+    Evaluations are gated by a module-level semaphore so a burst of feedback
+    submissions cannot flood the LLM API with concurrent requests.
+    
     Args:
         feedback_id: Feedback ID.
         feedback: Feedback data.
@@ -53,22 +61,27 @@ def process_feedback_async(
     """
     try:
         # Log feedback
-        logger.info(f"Processing feedback {feedback_id}: Rating {feedback.rating}")
+        logger.info("Processing feedback %s: Rating %s", feedback_id, feedback.rating)
         
         # Evaluate response (for comparison with user feedback)
-        evaluation = evaluator.evaluate_response(
-            query=feedback.query,
-            response=feedback.response
-        )
+        async with _evaluation_semaphore:
+            evaluation = await asyncio.to_thread(
+                evaluator.evaluate_response,
+                query=feedback.query,
+                response=feedback.response
+            )
         
         # Store feedback and evaluation (this would be implemented in a real system)
         # For now, just log it
-        logger.info(f"Feedback {feedback_id} processed. User rating: {feedback.rating}, System score: {evaluation.get('overall_score', 0)}")
+        logger.info(
+            "Feedback %s processed. User rating: %s, System score: %s",
+            feedback_id, feedback.rating, evaluation.get('overall_score', 0)
+        )
         
         # In a real system, this might update a database or trigger further analysis
     
     except Exception as e:
-        logger.error(f"Error processing feedback {feedback_id}: {str(e)}")
+        logger.error("Error processing feedback %s: %s", feedback_id, e)
 
 @router.post("", response_model=FeedbackResponse)
 async def submit_feedback(
@@ -108,7 +121,7 @@ async def submit_feedback(
         }
     
     except Exception as e:
-        logger.error(f"Error submitting feedback: {str(e)}")
+        logger.error("Error submitting feedback: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/stats")
@@ -154,7 +167,7 @@ async def get_feedback_stats(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting feedback stats: {str(e)}")
+        logger.error("Error getting feedback stats: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/evaluate")
@@ -196,5 +209,5 @@ async def manual_evaluation(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error performing manual evaluation: {str(e)}")
+        logger.error("Error performing manual evaluation: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
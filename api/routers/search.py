@@ -1,7 +1,11 @@
 # door_installation_assistant/api/routers/search.py
 import logging
+from bisect import bisect_left
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 
 from ...retrieval.retrieval_pipeline import RetrievalPipeline
@@ -34,12 +38,68 @@ class SearchResponse(BaseModel):
     count: int = Field(..., description="Total number of results")
     query: str = Field(..., description="Original query")
 
+# Common door installation queries
+COMMON_QUERIES = [
+    "How to install a prehung interior door",
+    "Measuring for a bifold door installation",
+    "Tools needed for door installation",
+    "Fixing a door that won't close properly",
+    "How to level a door frame",
+    "Installing door hinges properly",
+    "Shimming a door frame",
+    "How to cut a door to fit",
+    "Troubleshooting a sticky door",
+    "Safety precautions for door installation"
+]
+
+# Lowercased once so suggestion requests only lowercase the partial query
+_COMMON_QUERIES_LOWER = [(q, q.lower()) for q in COMMON_QUERIES]
+
+# Catalog sorted by lowercased text so prefix matches form a contiguous range
+_SUGGEST_INDEX = sorted(_COMMON_QUERIES_LOWER, key=lambda pair: pair[1])
+_SUGGEST_KEYS = [lower for _, lower in _SUGGEST_INDEX]
+
+def _prefix_suggestions(needle: str, limit: int) -> List[str]:
+    """Find catalog queries starting with the needle using binary search."""
+    matches = []
+    for i in range(bisect_left(_SUGGEST_KEYS, needle), len(_SUGGEST_KEYS)):
+        if len(matches) >= limit or not _SUGGEST_KEYS[i].startswith(needle):
+            break
+        matches.append(_SUGGEST_INDEX[i][0])
+    return matches
+
+@dataclass(slots=True)
+class _SearchHit:
+    """Compact record for a single retrieved document."""
+    id: str
+    text: str
+    score: float
+    metadata: Dict[str, Any]
+
+def _format_results(results: List[Dict[str, Any]]) -> List[_SearchHit]:
+    """Convert retrieval pipeline results into search hits."""
+    return [
+        _SearchHit(
+            result.get("id", ""),
+            result.get("text", ""),
+            result.get("score", 0.0),
+            result.get("metadata", {})
+        )
+        for result in results
+    ]
+
 # Get dependencies
+@lru_cache(maxsize=None)
 def get_retrieval_pipeline():
-    """Get retrieval pipeline instance."""
+    """
+    Get the shared retrieval pipeline instance.
+    
+    The pipeline holds the vector store and reranker clients, so it is built
+    once per process and reused across requests.
+    """
     return RetrievalPipeline()
 
-@router.post("", response_model=SearchResponse)
+@router.post("", response_class=ORJSONResponse, responses={200: {"model": SearchResponse}})
 async def search_documents(
     request: SearchRequest,
     user: Dict[str, Any] = Depends(get_current_user),
@@ -58,7 +118,7 @@ async def search_documents(
     """
     try:
         # Log search query
-        logger.info(f"Search query: {request.query}")
+        logger.info("Search query: %s", request.query)
         
         # Retrieve documents
         results = retrieval_pipeline.retrieve(
@@ -68,26 +128,20 @@ async def search_documents(
         )
         
         # Format results
-        search_results = []
-        for result in results:
-            search_results.append({
-                "id": result.get("id", ""),
-                "text": result.get("text", ""),
-                "score": result.get("score", 0.0),
-                "metadata": result.get("metadata", {})
-            })
+        search_results = _format_results(results)
         
-        return {
+        # Results are JSON-native, so skip response model validation and encoding
+        return ORJSONResponse({
             "results": search_results,
             "count": len(search_results),
             "query": request.query
-        }
+        })
     
     except Exception as e:
-        logger.error(f"Error searching documents: {str(e)}")
+        logger.error("Error searching documents: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.get("", response_model=SearchResponse)
+@router.get("", response_class=ORJSONResponse, responses={200: {"model": SearchResponse}})
 async def search_documents_get(
     query: str = Query(..., description="Search query"),
     top_k: int = Query(10, description="Number of results to return"),
@@ -123,7 +177,7 @@ async def search_documents_get(
             filter_dict["content_type"] = content_type
         
         # Log search query
-        logger.info(f"GET Search query: {query} with filters: {filter_dict}")
+        logger.info("GET Search query: %s with filters: %s", query, filter_dict)
         
         # Retrieve documents
         results = retrieval_pipeline.retrieve(
@@ -133,23 +187,17 @@ async def search_documents_get(
         )
         
         # Format results
-        search_results = []
-        for result in results:
-            search_results.append({
-                "id": result.get("id", ""),
-                "text": result.get("text", ""),
-                "score": result.get("score", 0.0),
-                "metadata": result.get("metadata", {})
-            })
+        search_results = _format_results(results)
         
-        return {
+        # Results are JSON-native, so skip response model validation and encoding
+        return ORJSONResponse({
             "results": search_results,
             "count": len(search_results),
             "query": query
-        }
+        })
     
     except Exception as e:
-        logger.error(f"Error searching documents: {str(e)}")
+        logger.error("Error searching documents: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/suggest")
@@ -171,29 +219,24 @@ async def suggest_queries(
     """
     try:
         # This is a simple implementation that could be enhanced with proper query suggestion logic
+        needle = query.lower()
+        needle_len = len(needle)
         
-        # Common door installation queries
-        common_queries = [
-            "How to install a prehung interior door",
-            "Measuring for a bifold door installation",
-            "Tools needed for door installation",
-            "Fixing a door that won't close properly",
-            "How to level a door frame",
-            "Installing door hinges properly",
-            "Shimming a door frame",
-            "How to cut a door to fit",
-            "Troubleshooting a sticky door",
-            "Safety precautions for door installation"
-        ]
-        
-        # Filter suggestions by partial query
-        suggestions = [q for q in common_queries if query.lower() in q.lower()]
+        # Prefix matches come straight from the sorted index
+        suggestions = _prefix_suggestions(needle, max_suggestions)
         
-        # Limit suggestions
-        suggestions = suggestions[:max_suggestions]
+        # Fill remaining slots with substring matches, stopping once enough are found
+        if len(suggestions) < max_suggestions:
+            for candidate, candidate_lower in _COMMON_QUERIES_LOWER:
+                if len(candidate_lower) < needle_len or candidate_lower.startswith(needle):
+                    continue
+                if needle in candidate_lower:
+                    suggestions.append(candidate)
+                    if len(suggestions) >= max_suggestions:
+                        break
         
         return {"suggestions": suggestions, "query": query}
     
     except Exception as e:
-        logger.error(f"Error generating suggestions: {str(e)}")
+        logger.error("Error generating suggestions: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
@@ -4,22 +4,59 @@ Configuration package for Door Installation Assistant.
 
 This package contains configuration modules for the Door Installation Assistant,
 including application settings, logging configuration, and model configuration.
+
+Submodules are imported on first attribute access, so importing one of them
+does not load the settings of the others.
 """
 
-from .app_config import get_config, AppConfig
-from .logging_config import get_logging_config, setup_logging, get_logger, LoggingConfig
-from .model_config import get_model_config, ModelConfig, OpenAIConfig, CohereConfig
+import importlib
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS = {
+    'get_config': '.app_config',
+    'AppConfig': '.app_config',
+    'get_logging_config': '.logging_config',
+    'reset_logging_config': '.logging_config',
+    'setup_logging': '.logging_config',
+    'get_logger': '.logging_config',
+    'get_fast_logger': '.logging_config',
+    'is_enabled': '.logging_config',
+    'FastLogger': '.logging_config',
+    'LoggingConfig': '.logging_config',
+    'get_model_config': '.model_config',
+    'reset_model_config': '.model_config',
+    'ModelConfig': '.model_config',
+    'OpenAIConfig': '.model_config',
+    'CohereConfig': '.model_config',
+}
+
+def __getattr__(name):
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(module_path, __name__)
+    value = getattr(module, name)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
 __all__ = [
     'get_config',
     'get_logging_config',
     'get_model_config',
+    'reset_logging_config',
+    'reset_model_config',
     'setup_logging',
     'get_logger',
+    'get_fast_logger',
+    'is_enabled',
+    'FastLogger',
     'AppConfig',
     'LoggingConfig',
     'ModelConfig',
     'OpenAIConfig',
     'CohereConfig',
-    
-]
\ No newline at end of file
+]
@@ -10,6 +10,7 @@ class VectorStoreConfig(BaseSettings):
     port: int = Field(6333, description="Vector store port")
     collection_name: str = Field("door_installations", description="Collection name in vector store")
     dimension: int = Field(1536, description="Embedding dimension")
+    quantization: str = Field("none", description="Vector quantization for new collections (none, int8)")
     
     class Config:
         env_prefix = "VECTOR_STORE_"
@@ -22,6 +23,15 @@ class DocumentProcessingConfig(BaseSettings):
     chunk_overlap: int = Field(200, description="Chunk overlap size")
     max_chunks_per_doc: int = Field(100, description="Maximum chunks per document")
     include_metadata: bool = Field(True, description="Whether to include metadata in chunks")
+    use_nltk: bool = Field(False, description="Split sentences with NLTK Punkt instead of the built-in splitter")
+    pdf_strategy: str = Field("auto", description="unstructured PDF partitioning strategy (auto, fast, hi_res, ocr_only)")
+    pdf_extract_images: bool = Field(True, description="Extract images when partitioning PDFs")
+    pdf_infer_table_structure: bool = Field(True, description="Extract tables and infer their structure when partitioning PDFs")
+    split_pdf_pages: bool = Field(False, description="Partition large PDFs as page ranges in parallel worker processes")
+    split_pdf_min_pages: int = Field(50, description="Minimum page count before a PDF is split into page ranges")
+    split_pdf_workers: Optional[int] = Field(None, description="Worker processes for split PDF partitioning; one per CPU if unset")
+    adaptive_pdf_strategy: bool = Field(False, description="Pick the PDF partitioning strategy from the page count")
+    fast_pdf_max_pages: int = Field(10, description="PDFs up to this many pages use the fast text-only strategy when adaptive")
     
     class Config:
         env_prefix = "DOC_PROC_"
@@ -44,8 +54,12 @@ class EmbeddingConfig(BaseSettings):
     provider: str = Field("openai", description="Embedding provider")
     model_name: str = Field("text-embedding-3-small", description="Embedding model name")
     batch_size: int = Field(100, description="Batch size for embedding generation")
+    max_concurrent_requests: int = Field(8, description="Maximum embedding API requests in flight at once")
+    max_retries: int = Field(6, description="Attempts per embedding API request before falling back")
+    retry_max_delay: float = Field(30.0, description="Upper bound in seconds on the jittered retry backoff")
     api_key: Optional[str] = Field(None, description="API key for embedding provider")
     dimension: int = Field(1536, description="Embedding dimension")
+    cache_path: Optional[str] = Field(None, description="SQLite file caching embeddings by text hash; disabled if unset")
        
     class Config:
         env_prefix = "OPENAI_"  # Changed to directly use OPENAI prefix
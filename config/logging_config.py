@@ -1,16 +1,61 @@
 # door_installation_assistant/config/logging_config.py
 import os
+import re
+import ast
+import gzip
+import time
+import atexit
+import queue
+import shutil
+import threading
+import functools
+import pathlib
+import linecache
+import warnings
 import logging
 import logging.handlers
-from typing import Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Literal, Optional, Tuple, Union
 from pydantic_settings import BaseSettings
 from pydantic import Field, validator
 
+# Accepted level names
+_LEVEL_NAMES = {
+    "CRITICAL": logging.CRITICAL,
+    "FATAL": logging.FATAL,
+    "ERROR": logging.ERROR,
+    "WARNING": logging.WARNING,
+    "WARN": logging.WARNING,
+    "INFO": logging.INFO,
+    "DEBUG": logging.DEBUG,
+    "NOTSET": logging.NOTSET,
+}
+
+def _parse_level(value: Union[str, int]) -> int:
+    """
+    Convert a logging level name or number to its integer value.
+    
+    Args:
+        value: Level name (case-insensitive) or integer level.
+        
+    Returns:
+        Integer logging level.
+        
+    Raises:
+        ValueError: If the level name is unknown.
+    """
+    if isinstance(value, int):
+        return value
+    level = _LEVEL_NAMES.get(str(value).strip().upper())
+    if level is None:
+        raise ValueError(f"Unknown logging level: {value}")
+    return level
+
 class LoggingConfig(BaseSettings):
     """Logging configuration settings."""
     
     # General logging settings
-    level: str = Field("INFO", description="Default logging level")
+    level: int = Field(logging.INFO, description="Default logging level")
     format: str = Field(
         "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         description="Log format string"
@@ -23,23 +68,44 @@ class LoggingConfig(BaseSettings):
     # File logging settings
     log_to_file: bool = Field(True, description="Whether to log to file")
     log_file: str = Field("logs/door_assistant.log", description="Log file path")
-    max_bytes: int = Field(10485760, description="Max log file size (10MB)")
-    backup_count: int = Field(5, description="Number of backup log files")
-    file_level: str = Field("DEBUG", description="Logging level for file handler")
+    rotation_mode: Literal["size", "time"] = Field("time", description="Rotate log files by size or by time")
+    rotation_when: str = Field("MIDNIGHT", description="Time unit for time-based rotation (S, M, H, D, MIDNIGHT, W0-W6)")
+    rotation_interval: int = Field(1, description="Number of time units between time-based rotations")
+    max_bytes: int = Field(
+        268435456,
+        description="Max log file size for size-based rotation (256MB); time-based rotation does not limit file size"
+    )
+    backup_count: int = Field(
+        7,
+        description="Number of backup log files; with time-based rotation, the number of intervals kept (a week of daily logs)"
+    )
+    compress_backups: bool = Field(False, description="Gzip rotated log files")
+    file_level: int = Field(logging.DEBUG, description="Logging level for file handler")
+    
+    # Asynchronous file logging settings
+    async_logging: bool = Field(True, description="Whether to write log files from a background thread")
+    queue_size: int = Field(
+        10000,
+        description="Maximum queued log records (0 for unbounded); records arriving at a full queue are dropped and counted"
+    )
+    buffer_bytes: int = Field(65536, description="Write buffer size for the log file")
+    flush_interval: float = Field(1.0, description="Seconds between log file flushes")
+    fast_format: bool = Field(False, description="Use epoch-millisecond timestamps in the log file")
+    strict_lazy_format: bool = Field(False, description="Warn about log calls that pre-format messages")
     
     # Console logging settings
     log_to_console: bool = Field(True, description="Whether to log to console")
-    console_level: str = Field("INFO", description="Logging level for console handler")
+    console_level: int = Field(logging.INFO, description="Logging level for console handler")
     
     # Module-specific logging levels
-    module_levels: Dict[str, str] = Field(
+    module_levels: Dict[str, int] = Field(
         default_factory=lambda: {
-            "door_installation_assistant.vector_storage": "INFO",
-            "door_installation_assistant.retrieval": "INFO",
-            "door_installation_assistant.llm_integration": "INFO",
-            "door_installation_assistant.agent_system": "INFO",
-            "door_installation_assistant.data_processing": "INFO",
-            "door_installation_assistant.api": "INFO",
+            "door_installation_assistant.vector_storage": logging.INFO,
+            "door_installation_assistant.retrieval": logging.INFO,
+            "door_installation_assistant.llm_integration": logging.INFO,
+            "door_installation_assistant.agent_system": logging.INFO,
+            "door_installation_assistant.data_processing": logging.INFO,
+            "door_installation_assistant.api": logging.INFO,
         },
         description="Module-specific logging levels"
     )
@@ -48,11 +114,390 @@ class LoggingConfig(BaseSettings):
         env_prefix = "LOG_"
         env_file = ".env"
         extra = "ignore"
+    
+    @validator("level", "file_level", "console_level", pre=True)
+    def validate_level(cls, v):
+        """Convert level names to integer levels."""
+        return _parse_level(v)
+    
+    @validator("module_levels", pre=True)
+    def validate_module_levels(cls, v):
+        """Convert module level names to integer levels."""
+        return {module: _parse_level(level) for module, level in v.items()}
+    
+    @functools.cached_property
+    def resolved_module_levels(self) -> List[Tuple[str, int]]:
+        """Module logger names paired with their integer levels."""
+        return list(self.module_levels.items())
+
+# Logger methods and the position of their message argument
+_LOG_METHOD_MESSAGE_INDEX = {
+    "debug": 0, "info": 0, "warning": 0, "warn": 0, "error": 0,
+    "exception": 0, "critical": 0, "fatal": 0, "log": 1,
+}
+
+@functools.lru_cache(maxsize=None)
+def _eager_format_lines(pathname: str) -> frozenset:
+    """
+    Get the source lines of log calls in a file whose message is an f-string.
+    
+    The file is parsed once. Every line a flagged call spans is included,
+    so a multi-line call matches whichever of its lines a record reports.
+    """
+    try:
+        tree = ast.parse("".join(linecache.getlines(pathname)), pathname)
+    except (SyntaxError, ValueError):
+        return frozenset()
+    
+    lines = set()
+    for node in ast.walk(tree):
+        if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)):
+            continue
+        index = _LOG_METHOD_MESSAGE_INDEX.get(node.func.attr)
+        if index is not None and len(node.args) > index and isinstance(node.args[index], ast.JoinedStr):
+            lines.update(range(node.lineno, (node.end_lineno or node.lineno) + 1))
+    return frozenset(lines)
+
+class LazyFormatFilter(logging.Filter):
+    """
+    Warn about log calls that build their message with an f-string.
+    
+    Such messages are formatted even when the level is disabled; passing
+    arguments (``logger.debug("x=%s", x)``) defers that work to the handler.
+    Each source file is parsed once and each call site checked once, so this
+    is meant for development rather than production.
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self._checked_sites = set()
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not record.args:
+            site = (record.pathname, record.lineno)
+            if site not in self._checked_sites:
+                self._checked_sites.add(site)
+                if record.lineno in _eager_format_lines(record.pathname):
+                    # Attribute the warning to the log call rather than this filter
+                    warnings.warn_explicit(
+                        "eager-formatted log message", RuntimeWarning,
+                        record.pathname, record.lineno, module=record.module
+                    )
+        return True
+
+# Plain %(field)s placeholder in a log format string
+_FORMAT_FIELD_RE = re.compile(r"%\((\w+)\)s")
+
+class CompiledFormatter(logging.Formatter):
+    """
+    Formatter that splits its format string into literals and fields once.
+    
+    Records are rendered by joining the literals with the record attributes
+    directly, skipping the per-record ``record.__dict__`` mapping and
+    %-formatting of the standard formatter. Formats with placeholders other
+    than ``%(field)s`` (widths, numeric conversions) use the standard path.
+    """
+    
+    def __init__(self, fmt: Optional[str] = None, datefmt: Optional[str] = None):
+        super().__init__(fmt, datefmt)
+        parts = _FORMAT_FIELD_RE.split(self._fmt)
+        literals = parts[0::2]
+        
+        if any("%" in literal.replace("%%", "") for literal in literals):
+            self._head = None
+            self._fields = ()
+        else:
+            literals = [literal.replace("%%", "%") for literal in literals]
+            self._head = literals[0]
+            self._fields = tuple(zip(parts[1::2], literals[1:]))
+        self._needs_asctime = self.usesTime()
+    
+    def format(self, record: logging.LogRecord) -> str:
+        """Format the record by joining precompiled literals and fields."""
+        if self._head is None:
+            return super().format(record)
+        
+        record.message = record.getMessage()
+        if self._needs_asctime:
+            record.asctime = self.formatTime(record, self.datefmt)
+        
+        out = [self._head]
+        for field, literal in self._fields:
+            out.append(str(getattr(record, field)))
+            out.append(literal)
+        s = "".join(out)
+        
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            if s[-1:] != "\n":
+                s += "\n"
+            s += record.exc_text
+        if record.stack_info:
+            if s[-1:] != "\n":
+                s += "\n"
+            s += self.formatStack(record.stack_info)
+        return s
+
+class FastFormatter(CompiledFormatter):
+    """Formatter that renders timestamps as epoch milliseconds."""
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        """Format the record time without localtime/strftime calls."""
+        return str(int(record.created * 1000))
+
+# Single worker so backup shifts from successive rollovers never interleave
+_rotation_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="log-rotate")
+
+class _BufferedRotationMixin:
+    """
+    Buffered writes and background rotation for the rotating file handlers.
+    
+    The standard handlers flush after every record; these let records
+    accumulate in the stream buffer and flush them every ``flush_interval``
+    seconds, on rollover and on close. The file is opened in binary mode and
+    each record is encoded once, skipping the text layer's codec.
+    
+    On rollover the full log is renamed aside and a fresh file opened straight
+    away; moving it into place as a backup (gzipped when ``compress_backups``
+    is set) and pruning old backups happen on the rotation thread.
+    """
+    
+    def _init_buffering(self, buffer_bytes: int, flush_interval: float, compress_backups: bool) -> None:
+        """Store buffering options; must run before the file is opened."""
+        self.buffer_bytes = buffer_bytes
+        self.flush_interval = flush_interval
+        self.compress_backups = compress_backups
+    
+    def _start_buffering(self) -> None:
+        """Resolve the byte encoding and start the periodic flush thread."""
+        encoding = self.encoding
+        self._byte_encoding = "utf-8" if encoding in (None, "locale") else encoding
+        self._byte_errors = self.errors or "replace"
+        
+        self._flush_stop = threading.Event()
+        self._flush_thread = threading.Thread(
+            target=self._flush_periodically, name="log-flush", daemon=True
+        )
+        self._flush_thread.start()
+    
+    def _open(self):
+        """Open the log file for binary writes with a larger buffer."""
+        return open(self.baseFilename, self.mode + "b", buffering=self.buffer_bytes)
+    
+    def _should_rollover(self, record: logging.LogRecord, size: int) -> bool:
+        """Check whether writing size more bytes should trigger a rollover."""
+        return bool(self.shouldRollover(record))
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        """Format and encode the record once, rolling over first if needed."""
+        try:
+            data = (self.format(record) + self.terminator).encode(
+                self._byte_encoding, self._byte_errors
+            )
+            if self._should_rollover(record, len(data)):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(data)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def flush(self) -> None:
+        """Skip the per-record flush; the timer thread flushes instead."""
+    
+    def flush_buffer(self) -> None:
+        """Flush buffered records to disk."""
+        self.acquire()
+        try:
+            if self.stream and hasattr(self.stream, "flush"):
+                self.stream.flush()
+        finally:
+            self.release()
+    
+    def _flush_periodically(self) -> None:
+        """Flush the buffer every flush_interval seconds until closed."""
+        while not self._flush_stop.wait(self.flush_interval):
+            self.flush_buffer()
+    
+    def _move_aside(self, source: str) -> str:
+        """Rename a full log file to a unique pending name and return it."""
+        pending = f"{source}.rotating-{os.getpid()}-{time.time_ns()}"
+        os.rename(source, pending)
+        return pending
+    
+    def _install_backup(self, pending: str, dest: str) -> None:
+        """Move a pending file to its backup name, compressing it if enabled."""
+        if self.compress_backups:
+            with open(pending, "rb") as src, gzip.open(dest + ".gz", "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            os.remove(pending)
+        else:
+            super().rotate(pending, dest)
+    
+    def close(self) -> None:
+        """Stop the flush timer and close the file, flushing the buffer."""
+        self._flush_stop.set()
+        self.flush_buffer()
+        super().close()
+
+class BufferedRotatingFileHandler(_BufferedRotationMixin, logging.handlers.RotatingFileHandler):
+    """Size-based rotating file handler with buffered writes and background rotation."""
+    
+    def __init__(
+        self,
+        filename: str,
+        mode: str = "a",
+        maxBytes: int = 0,
+        backupCount: int = 0,
+        encoding: Optional[str] = None,
+        delay: bool = False,
+        buffer_bytes: int = 65536,
+        flush_interval: float = 1.0,
+        compress_backups: bool = False,
+    ):
+        self._init_buffering(buffer_bytes, flush_interval, compress_backups)
+        super().__init__(filename, mode, maxBytes, backupCount, encoding, delay)
+        self._start_buffering()
+    
+    def _should_rollover(self, record: logging.LogRecord, size: int) -> bool:
+        """Check the file size using the already encoded record length."""
+        if self.maxBytes <= 0:
+            return False
+        if self.stream is None:
+            self.stream = self._open()
+        return self.stream.tell() + size >= self.maxBytes
+    
+    def doRollover(self) -> None:
+        """Move the full log aside, reopen it and queue the backup shift."""
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+        if self.backupCount > 0 and os.path.exists(self.baseFilename):
+            pending = self._move_aside(self.baseFilename)
+            _rotation_executor.submit(self._shift_backups, pending)
+        if not self.delay:
+            self.stream = self._open()
+    
+    def _backup_filename(self, index: int) -> str:
+        """Get the file name of the numbered backup."""
+        name = self.rotation_filename(f"{self.baseFilename}.{index}")
+        return name + ".gz" if self.compress_backups else name
+    
+    def _shift_backups(self, pending: str) -> None:
+        """Shift the numbered backups up by one and install pending as backup 1."""
+        try:
+            for index in range(self.backupCount - 1, 0, -1):
+                source = self._backup_filename(index)
+                if os.path.exists(source):
+                    os.replace(source, self._backup_filename(index + 1))
+            self._install_backup(pending, self.rotation_filename(f"{self.baseFilename}.1"))
+        except OSError:
+            logging.getLogger(__name__).exception("Failed to rotate log file %s", pending)
+
+class BufferedTimedRotatingFileHandler(_BufferedRotationMixin, logging.handlers.TimedRotatingFileHandler):
+    """Time-based rotating file handler with buffered writes and background rotation."""
+    
+    def __init__(
+        self,
+        filename: str,
+        when: str = "h",
+        interval: int = 1,
+        backupCount: int = 0,
+        encoding: Optional[str] = None,
+        delay: bool = False,
+        utc: bool = False,
+        buffer_bytes: int = 65536,
+        flush_interval: float = 1.0,
+        compress_backups: bool = False,
+    ):
+        self._init_buffering(buffer_bytes, flush_interval, compress_backups)
+        super().__init__(filename, when, interval, backupCount, encoding, delay, utc)
+        self._start_buffering()
+    
+    def rotate(self, source: str, dest: str) -> None:
+        """Move the full log aside and queue moving it to its dated name."""
+        pending = self._move_aside(source)
+        _rotation_executor.submit(self._finish_rotation, pending, dest)
+    
+    def getFilesToDelete(self) -> list:
+        """Defer pruning old backups to the rotation thread."""
+        return []
+    
+    def _finish_rotation(self, pending: str, dest: str) -> None:
+        """Install pending under its dated name and prune old backups."""
+        try:
+            self._install_backup(pending, dest)
+            if self.backupCount > 0:
+                for name in super().getFilesToDelete():
+                    os.remove(name)
+        except OSError:
+            logging.getLogger(__name__).exception("Failed to rotate log file %s", pending)
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that drops records instead of erroring when the queue is full.
+    
+    The stock handler reports every record a full queue rejects through
+    handleError, printing a traceback to stderr per record, so a log burst
+    becomes a stderr flood. Here callers never block: rejected records are
+    counted, and the count is logged as a single warning with the next record
+    that fits.
+    """
+    
+    def __init__(self, queue):
+        super().__init__(queue)
+        # Only touched in enqueue, which runs under the handler lock
+        self.dropped = 0
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Queue the record, or count it as dropped if the queue is full."""
+        try:
+            if self.dropped:
+                self.queue.put_nowait(logging.LogRecord(
+                    __name__, logging.WARNING, __file__, 0,
+                    "Dropped %s log records because the log queue was full", (self.dropped,), None
+                ))
+                self.dropped = 0
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+# Effective logger levels snapshotted by setup_logging
+_level_cache: Dict[str, int] = {}
+
+# Record attributes that are only worth collecting when the format uses them
+_RECORD_COLLECTION_FLAGS = {
+    "logThreads": ("%(thread)", "%(threadName)"),
+    "logProcesses": ("%(process)",),
+    "logMultiprocessing": ("%(processName)",),
+}
+
+# Listener that owns the file handler when asynchronous logging is enabled
+_queue_listener: Optional[logging.handlers.QueueListener] = None
 
+def _stop_queue_listener() -> None:
+    """Stop the active queue listener, flushing any queued records."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+
+atexit.register(_stop_queue_listener)
+
+@functools.lru_cache(maxsize=1)
 def get_logging_config() -> LoggingConfig:
-    """Get the logging configuration."""
+    """Get the logging configuration, built once per process."""
     return LoggingConfig()
 
+def reset_logging_config() -> None:
+    """Discard the cached logging configuration so it is rebuilt on next use."""
+    get_logging_config.cache_clear()
+
 def setup_logging(config: Optional[LoggingConfig] = None) -> None:
     """
     Set up logging based on configuration.
@@ -60,46 +505,97 @@ def setup_logging(config: Optional[LoggingConfig] = None) -> None:
     Args:
         config: Logging configuration. If None, default config is used.
     """
+    global _queue_listener
+    
     if config is None:
         config = get_logging_config()
     
+    _level_cache.clear()
+    
+    # Skip per-record thread/process lookups the format never prints
+    for flag, fields in _RECORD_COLLECTION_FLAGS.items():
+        setattr(logging, flag, any(field in config.format for field in fields))
+    
     # Create logs directory if it doesn't exist
     if config.log_to_file:
-        os.makedirs(os.path.dirname(config.log_file), exist_ok=True)
+        pathlib.Path(config.log_file).parent.mkdir(parents=True, exist_ok=True)
     
     # Configure root logger
     root_logger = logging.getLogger()
-    root_logger.setLevel(logging.getLevelName(config.level))
+    root_logger.setLevel(config.level)
     
-    # Remove existing handlers
+    # Remove existing handlers, closing them so buffered file handlers
+    # flush, stop their flush threads and release their files
+    _stop_queue_listener()
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
+        handler.close()
     
     # Create formatters
-    formatter = logging.Formatter(config.format, config.date_format)
+    formatter = CompiledFormatter(config.format, config.date_format)
     
     # Add file handler if enabled
     if config.log_to_file:
-        file_handler = logging.handlers.RotatingFileHandler(
-            config.log_file,
-            maxBytes=config.max_bytes,
-            backupCount=config.backup_count
+        if config.rotation_mode == "time":
+            file_handler = BufferedTimedRotatingFileHandler(
+                config.log_file,
+                when=config.rotation_when,
+                interval=config.rotation_interval,
+                backupCount=config.backup_count,
+                buffer_bytes=config.buffer_bytes,
+                flush_interval=config.flush_interval,
+                compress_backups=config.compress_backups
+            )
+        else:
+            file_handler = BufferedRotatingFileHandler(
+                config.log_file,
+                maxBytes=config.max_bytes,
+                backupCount=config.backup_count,
+                buffer_bytes=config.buffer_bytes,
+                flush_interval=config.flush_interval,
+                compress_backups=config.compress_backups
+            )
+        file_handler.setLevel(config.file_level)
+        file_handler.setFormatter(
+            FastFormatter(config.format) if config.fast_format else formatter
         )
-        file_handler.setLevel(logging.getLevelName(config.file_level))
-        file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        
+        if config.async_logging:
+            # Callers only enqueue records; the listener thread does the disk I/O
+            log_queue = queue.Queue(maxsize=config.queue_size)
+            _queue_listener = logging.handlers.QueueListener(
+                log_queue, file_handler, respect_handler_level=True
+            )
+            _queue_listener.start()
+            queue_handler = DroppingQueueHandler(log_queue)
+            queue_handler.setLevel(file_handler.level)
+            root_logger.addHandler(queue_handler)
+        else:
+            root_logger.addHandler(file_handler)
     
     # Add console handler if enabled
     if config.log_to_console:
         console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.getLevelName(config.console_level))
+        console_handler.setLevel(config.console_level)
         console_handler.setFormatter(formatter)
         root_logger.addHandler(console_handler)
     
-    # Set module-specific logging levels
-    for module, level in config.module_levels.items():
-        logger = logging.getLogger(module)
-        logger.setLevel(logging.getLevelName(level))
+    # Flag eager-formatted messages on every handler (logger filters miss propagated records)
+    if config.strict_lazy_format:
+        lazy_format_filter = LazyFormatFilter()
+        for handler in root_logger.handlers:
+            handler.addFilter(lazy_format_filter)
+    
+    # Set module-specific logging levels, skipping loggers already at their
+    # level since every setLevel clears the level cache of all loggers
+    logger_dict = logging.Logger.manager.loggerDict
+    for module, level in config.resolved_module_levels:
+        logger = logger_dict.get(module)
+        if not isinstance(logger, logging.Logger):
+            logger = logging.getLogger(module)
+        if logger.level != level:
+            logger.setLevel(level)
+        _level_cache[module] = logger.getEffectiveLevel()
     
     # Log startup message
     logging.info("Logging configured")
@@ -114,4 +610,58 @@ def get_logger(name: str) -> logging.Logger:
     Returns:
         Logger instance.
     """
-    return logging.getLogger(name)
\ No newline at end of file
+    return logging.getLogger(name)
+
+def is_enabled(name: str, level: int) -> bool:
+    """
+    Check whether a logger would handle records at the given level.
+    
+    Effective levels are cached per logger name and reset by setup_logging,
+    so the check is a dict lookup and an int comparison.
+    
+    Args:
+        name: Logger name.
+        level: Logging level to check.
+        
+    Returns:
+        True if records at the level would be handled.
+    """
+    effective_level = _level_cache.get(name)
+    if effective_level is None:
+        effective_level = logging.getLogger(name).getEffectiveLevel()
+        _level_cache[name] = effective_level
+    return level >= effective_level
+
+class FastLogger:
+    """Logger wrapper exposing cached level checks for hot-path log sites."""
+    
+    __slots__ = ("name", "logger")
+    
+    def __init__(self, name: str):
+        self.name = name
+        self.logger = logging.getLogger(name)
+    
+    @property
+    def debug_enabled(self) -> bool:
+        """Whether DEBUG records would be handled."""
+        return is_enabled(self.name, logging.DEBUG)
+    
+    @property
+    def info_enabled(self) -> bool:
+        """Whether INFO records would be handled."""
+        return is_enabled(self.name, logging.INFO)
+    
+    def __getattr__(self, attr: str):
+        return getattr(self.logger, attr)
+
+def get_fast_logger(name: str) -> FastLogger:
+    """
+    Get a logger wrapper with cached level checks.
+    
+    Args:
+        name: Logger name, typically __name__ from the calling module.
+        
+    Returns:
+        FastLogger instance.
+    """
+    return FastLogger(name)
@@ -1,8 +1,9 @@
 # door_installation_assistant/config/model_config.py
-from typing import Dict, List, Any, Optional, Union
+from typing import ClassVar, Dict, List, Any, Optional, Union
 from pydantic_settings import BaseSettings
-from pydantic import Field, validator
+from pydantic import Field, PrivateAttr, validator
 import os
+import functools
 
 class OpenAIConfig(BaseSettings):
     """OpenAI model configuration."""
@@ -77,6 +78,16 @@ class CohereConfig(BaseSettings):
             v = os.environ.get("COHERE_API_KEY")
         return v
 
+@functools.lru_cache(maxsize=1)
+def _shared_openai_config() -> OpenAIConfig:
+    """Get the OpenAI configuration shared by all model configs."""
+    return OpenAIConfig()
+
+@functools.lru_cache(maxsize=1)
+def _shared_cohere_config() -> CohereConfig:
+    """Get the Cohere configuration shared by all model configs."""
+    return CohereConfig()
+
 class ModelConfig(BaseSettings):
     """Model configuration settings."""
     
@@ -99,8 +110,8 @@ class ModelConfig(BaseSettings):
     )
     
     # Provider configurations
-    openai: OpenAIConfig = Field(default_factory=OpenAIConfig)
-    cohere: CohereConfig = Field(default_factory=CohereConfig)
+    openai: OpenAIConfig = Field(default_factory=_shared_openai_config)
+    cohere: CohereConfig = Field(default_factory=_shared_cohere_config)
     
     # Door type identification models
     door_identification_model: str = Field(
@@ -126,24 +137,18 @@ class ModelConfig(BaseSettings):
         description="Model for response evaluation"
     )
     
-    # Model context windows (in tokens)
-    context_windows: Dict[str, int] = Field(
-        default_factory=lambda: {
-            "openai/gpt-4o": 32000,
-            "openai/gpt-3.5-turbo": 16000,
-        },
-        description="Context window sizes for models"
-    )
+    # Model context windows (in tokens); static model facts shared by all instances
+    context_windows: ClassVar[Dict[str, int]] = {
+        "openai/gpt-4o": 32000,
+        "openai/gpt-3.5-turbo": 16000,
+    }
     
-    # Embedding dimensions
-    embedding_dimensions: Dict[str, int] = Field(
-        default_factory=lambda: {
-            "openai/text-embedding-3-large": 3072,
-            "openai/text-embedding-3-small": 1536,
-            "cohere/embed-english-v3.0": 1024,
-        },
-        description="Embedding dimensions for models"
-    )
+    # Embedding dimensions; static model facts shared by all instances
+    embedding_dimensions: ClassVar[Dict[str, int]] = {
+        "openai/text-embedding-3-large": 3072,
+        "openai/text-embedding-3-small": 1536,
+        "cohere/embed-english-v3.0": 1024,
+    }
     
     # Prompt templates file path
     prompt_templates_file: str = Field(
@@ -151,11 +156,71 @@ class ModelConfig(BaseSettings):
         description="Path to prompt templates file"
     )
     
+    # Lookups resolved once for the configured primary providers
+    _embedding_dimension_lookup: Dict[str, int] = PrivateAttr(default_factory=dict)
+    _context_window_lookup: Dict[str, int] = PrivateAttr(default_factory=dict)
+    _default_embedding_dimension: int = PrivateAttr(1536)
+    _default_context_window: int = PrivateAttr(16000)
+    
+    # Provider name -> provider configuration
+    _llm_providers: Dict[str, Any] = PrivateAttr(default_factory=dict)
+    _embedding_providers: Dict[str, Any] = PrivateAttr(default_factory=dict)
+    _reranking_providers: Dict[str, Any] = PrivateAttr(default_factory=dict)
+    
     class Config:
         env_prefix = "MODEL_"
         env_file = ".env"
         extra = "ignore"
     
+    def model_post_init(self, __context: Any) -> None:
+        """Resolve provider and model lookups so getters need a single dict lookup."""
+        self._llm_providers = {"openai": self.openai}
+        self._embedding_providers = {"openai": self.openai, "cohere": self.cohere}
+        self._reranking_providers = {"cohere": self.cohere}
+        
+        self._embedding_dimension_lookup = self._resolve_model_lookup(
+            self.embedding_dimensions, self.primary_embedding_provider
+        )
+        self._context_window_lookup = self._resolve_model_lookup(
+            self.context_windows, self.primary_llm_provider
+        )
+        
+        default_embedding_models = {
+            "openai": self.openai.embedding_model,
+            "cohere": self.cohere.embedding_model,
+        }
+        embedding_model = default_embedding_models.get(self.primary_embedding_provider)
+        if embedding_model is not None:
+            self._default_embedding_dimension = self._embedding_dimension_lookup.get(
+                f"{self.primary_embedding_provider}/{embedding_model}", 1536
+            )
+        
+        default_chat_models = {"openai": self.openai.chat_model}
+        chat_model = default_chat_models.get(self.primary_llm_provider)
+        if chat_model is not None:
+            self._default_context_window = self._context_window_lookup.get(
+                f"{self.primary_llm_provider}/{chat_model}", 16000
+            )
+    
+    @staticmethod
+    def _resolve_model_lookup(table: Dict[str, int], primary_provider: str) -> Dict[str, int]:
+        """
+        Extend a provider-prefixed table with bare names for the primary provider.
+        
+        Args:
+            table: Mapping of "provider/model" names to values.
+            primary_provider: Provider assumed for model names without a prefix.
+            
+        Returns:
+            Mapping accepting both prefixed and bare model names.
+        """
+        lookup = dict(table)
+        prefix = f"{primary_provider}/"
+        for name, value in table.items():
+            if name.startswith(prefix):
+                lookup[name[len(prefix):]] = value
+        return lookup
+    
     def get_llm_provider_config(self, provider: Optional[str] = None) -> Union[OpenAIConfig]:
         """
         Get the configuration for a specific LLM provider.
@@ -168,10 +233,10 @@ class ModelConfig(BaseSettings):
         """
         provider = provider or self.primary_llm_provider
         
-        if provider == "openai":
-            return self.openai
-        else:
+        config = self._llm_providers.get(provider)
+        if config is None:
             raise ValueError(f"Unknown LLM provider: {provider}")
+        return config
     
     def get_embedding_provider_config(self, provider: Optional[str] = None) -> Union[OpenAIConfig, CohereConfig]:
         """
@@ -185,12 +250,10 @@ class ModelConfig(BaseSettings):
         """
         provider = provider or self.primary_embedding_provider
         
-        if provider == "openai":
-            return self.openai
-        elif provider == "cohere":
-            return self.cohere
-        else:
+        config = self._embedding_providers.get(provider)
+        if config is None:
             raise ValueError(f"Unknown embedding provider: {provider}")
+        return config
     
     def get_reranking_provider_config(self, provider: Optional[str] = None) -> CohereConfig:
         """
@@ -204,10 +267,10 @@ class ModelConfig(BaseSettings):
         """
         provider = provider or self.primary_reranking_provider
         
-        if provider == "cohere":
-            return self.cohere
-        else:
+        config = self._reranking_providers.get(provider)
+        if config is None:
             raise ValueError(f"Unknown reranking provider: {provider}")
+        return config
     
     def get_embedding_dimension(self, model: Optional[str] = None) -> int:
         """
@@ -220,21 +283,10 @@ class ModelConfig(BaseSettings):
             Embedding dimension.
         """
         if model is None:
-            provider = self.primary_embedding_provider
-            if provider == "openai":
-                model = f"{provider}/{self.openai.embedding_model}"
-            elif provider == "cohere":
-                model = f"{provider}/{self.cohere.embedding_model}"
-        
-        # If model doesn't have provider prefix, add the primary provider
-        if "/" not in model:
-            model = f"{self.primary_embedding_provider}/{model}"
+            return self._default_embedding_dimension
         
-        if model in self.embedding_dimensions:
-            return self.embedding_dimensions[model]
-        else:
-            # Return a default dimension
-            return 1536
+        # Bare model names resolve against the primary provider; unknown models get a default
+        return self._embedding_dimension_lookup.get(model, 1536)
     
     def get_context_window(self, model: Optional[str] = None) -> int:
         """
@@ -247,20 +299,18 @@ class ModelConfig(BaseSettings):
             Context window size in tokens.
         """
         if model is None:
-            provider = self.primary_llm_provider
-            if provider == "openai":
-                model = f"{provider}/{self.openai.chat_model}"
+            return self._default_context_window
         
-        # If model doesn't have provider prefix, add the primary provider
-        if "/" not in model:
-            model = f"{self.primary_llm_provider}/{model}"
-        
-        if model in self.context_windows:
-            return self.context_windows[model]
-        else:
-            # Return a conservative default
-            return 16000
+        # Bare model names resolve against the primary provider; unknown models get a conservative default
+        return self._context_window_lookup.get(model, 16000)
 
+@functools.lru_cache(maxsize=1)
 def get_model_config() -> ModelConfig:
-    """Get the model configuration."""
-    return ModelConfig()
\ No newline at end of file
+    """Get the model configuration, built once per process."""
+    return ModelConfig()
+
+def reset_model_config() -> None:
+    """Discard the cached model configurations so they are rebuilt on next use."""
+    get_model_config.cache_clear()
+    _shared_openai_config.cache_clear()
+    _shared_cohere_config.cache_clear()
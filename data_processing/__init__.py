@@ -1,40 +1,68 @@
 """
 Document processing module for door installation assistant.
 Handles PDF extraction, chunking, and embedding generation.
+
+Submodules are imported on first attribute access so that importing one
+lightweight helper does not pull in the PDF and embedding dependencies.
 """
 
-from data_processing.document_processor import (
-    DocumentProcessor,
-    PDFDocumentProcessor,
-    process_document,
-    process_documents_batch,
-    get_document_processor
-)
-
-from data_processing.chunking_strategies import (
-    ChunkingStrategy,
-    HierarchicalChunkingStrategy,
-    SemanticChunkingStrategy,
-    FixedSizeChunkingStrategy,
-    get_chunking_strategy
-)
-
-from data_processing.embedding_generator import (
-    EmbeddingGenerator,
-    MockEmbeddingGenerator
-)
+import importlib
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS = {
+    # Document processing
+    'DocumentProcessor': '.document_processor',
+    'PDFDocumentProcessor': '.document_processor',
+    'process_document': '.document_processor',
+    'process_documents_batch': '.document_processor',
+    'create_document_pool': '.document_processor',
+    'get_document_processor': '.document_processor',
+
+    # Chunking
+    'Chunk': '.chunking_strategies',
+    'ChunkingStrategy': '.chunking_strategies',
+    'HierarchicalChunkingStrategy': '.chunking_strategies',
+    'SemanticChunkingStrategy': '.chunking_strategies',
+    'FixedSizeChunkingStrategy': '.chunking_strategies',
+    'get_chunking_strategy': '.chunking_strategies',
+    'chunk_documents': '.chunking_strategies',
+    'create_chunks_parallel': '.chunking_strategies',
+
+    # Embeddings
+    'EmbeddingGenerator': '.embedding_generator',
+    'MockEmbeddingGenerator': '.embedding_generator',
+    'CachedEmbeddingGenerator': '.embedding_generator',
+}
+
+def __getattr__(name):
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(module_path, __name__)
+    value = getattr(module, name)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
 __all__ = [
     'process_document',
     'process_documents_batch',
+    'create_document_pool',
     'DocumentProcessor',
     'PDFDocumentProcessor',
+    'Chunk',
     'ChunkingStrategy',
     'HierarchicalChunkingStrategy',
     'SemanticChunkingStrategy',
     'FixedSizeChunkingStrategy',
     'get_chunking_strategy',
+    'chunk_documents',
+    'create_chunks_parallel',
     'EmbeddingGenerator',
     'MockEmbeddingGenerator',
+    'CachedEmbeddingGenerator',
     'get_document_processor',
-]
\ No newline at end of file
+]
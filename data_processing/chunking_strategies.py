@@ -4,29 +4,232 @@ Handles various approaches to splitting documents into manageable chunks.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Iterable, Iterator, Mapping, Optional, Sequence, Tuple
+import bisect
+import functools
+import importlib.util
+import itertools
 import logging
 import re
+import types
 
-# Import NLTK conditionally to handle import errors
+# NLTK is optional and only imported, with its Punkt data fetched, on first use
+NLTK_AVAILABLE = importlib.util.find_spec("nltk") is not None
+
+# Import the Aho-Corasick matcher conditionally; topic detection falls back to a regex scan
 try:
-    import nltk
-    from nltk.tokenize import sent_tokenize
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+from config.app_config import get_config
+
+logger = logging.getLogger(__name__)
+
+# Regular expressions compiled once for the per-element hot loops. The
+# sentence pattern matches a sentence end followed by a capital or digit, or
+# a line break (captured, so split results tell the two kinds apart), so the
+# text is scanned once.
+_SENT_SPLIT_RE = re.compile(r"(?<=[.!?])[^\S\n]+(?=[A-Z0-9])|(\n)")
+_STEP_NUM_RE = re.compile(r"step\s+(\d+)", re.IGNORECASE)
+_STEP_TOPIC_RE = re.compile(r"step\s+\d+", re.IGNORECASE)
+
+# Topic keywords in priority order; the first topic with a keyword in the text wins
+_TOPIC_KEYWORDS = (
+    ("installation_step", ("install",)),
+    ("tool", ("tool", "equipment")),
+    ("component", ("component", "part", "hardware")),
+    ("door_type", ("door type", "door model")),
+    ("safety", ("safety", "warning", "caution")),
+)
+
+def _build_topic_automaton():
+    """Build an automaton mapping each topic keyword to (priority, topic)."""
+    automaton = ahocorasick.Automaton()
+    for priority, (topic, keywords) in enumerate(_TOPIC_KEYWORDS):
+        for keyword in keywords:
+            automaton.add_word(keyword, (priority, topic))
+    automaton.make_automaton()
+    return automaton
+
+_TOPIC_AUTOMATON = _build_topic_automaton() if AHOCORASICK_AVAILABLE else None
+
+# Fallback scan without the automaton. Each topic is a named group so a
+# match reports its topic directly; the groups sit in a lookahead so
+# overlapping matches are still reported, and case is ignored so the text
+# needs no lowercased copy.
+_TOPIC_PRIORITY = {
+    topic: priority for priority, (topic, _) in enumerate(_TOPIC_KEYWORDS)
+}
+_TOPIC_RE = re.compile(
+    "(?=" + "|".join(
+        f"(?P<{topic}>" + "|".join(re.escape(keyword) for keyword in keywords) + ")"
+        for topic, keywords in _TOPIC_KEYWORDS
+    ) + ")",
+    re.IGNORECASE
+)
+
+def _scan_topic(text: str) -> str:
+    """Determine the topic of a text from its step pattern and keywords."""
+    # Check for numbered steps before the keyword scan
+    if _STEP_TOPIC_RE.search(text):
+        return "installation_step"
+    
+    # Scan for all topic keywords in one pass and keep the highest priority match
+    if _TOPIC_AUTOMATON is not None:
+        matches = (value for _, value in _TOPIC_AUTOMATON.iter(text.lower()))
+    else:
+        matches = (
+            (_TOPIC_PRIORITY[match.lastgroup], match.lastgroup)
+            for match in _TOPIC_RE.finditer(text)
+        )
+    
+    best_priority, best_topic = len(_TOPIC_KEYWORDS), "general_info"
+    for priority, topic in matches:
+        if priority < best_priority:
+            if priority == 0:
+                return topic
+            best_priority, best_topic = priority, topic
+    return best_topic
+
+# Templated manuals repeat short elements verbatim, so topics of texts up to
+# this length are cached; longer texts are scanned directly to bound memory
+_TOPIC_CACHE_MAX_LEN = 1024
+
+_determine_topic_cached = functools.lru_cache(maxsize=4096)(_scan_topic)
+
+@functools.cache
+def _ensure_punkt() -> bool:
+    """
+    Import NLTK and download the Punkt model data if it is missing.
     
-    # Ensure NLTK data is downloaded
+    Runs once, on the first sentence split that uses NLTK, so importing this
+    module does no filesystem probing or network access.
+    
+    Returns:
+        True if NLTK could be imported.
+    """
     try:
-        nltk.data.find('tokenizers/punkt')
+        import nltk
+    except ImportError:
+        logger.warning("NLTK not available. Using simple sentence splitting.")
+        return False
+    
+    # Releases with PunktTokenizer load the model from punkt_tab
+    resource = "punkt_tab" if hasattr(nltk.tokenize, "PunktTokenizer") else "punkt"
+    try:
+        nltk.data.find(f"tokenizers/{resource}")
     except LookupError:
-        nltk.download('punkt', quiet=True)
+        nltk.download(resource, quiet=True)
+    return True
+
+@functools.lru_cache(maxsize=8)
+def _get_punkt(language: str = "english"):
+    """
+    Load the Punkt sentence tokenizer for a language once.
     
-    NLTK_AVAILABLE = True
-except ImportError:
-    NLTK_AVAILABLE = False
-    logging.warning("NLTK not available. Using simple sentence splitting.")
+    sent_tokenize rebuilds the tokenizer on every call in some NLTK releases,
+    so the instance is cached here and its tokenize method called directly.
+    
+    Returns:
+        Punkt tokenizer, or None if the Punkt model data is not installed.
+    """
+    if not _ensure_punkt():
+        return None
+    
+    import nltk
+    try:
+        if hasattr(nltk.tokenize, "PunktTokenizer"):
+            return nltk.tokenize.PunktTokenizer(language)
+        return nltk.data.load(f"tokenizers/punkt/{language}.pickle")
+    except LookupError:
+        logger.warning("Punkt model for %s not available. Using simple sentence splitting.", language)
+        return None
 
-from config.app_config import get_config
+# Shared read-only default for missing metadata, instead of a new {} per lookup
+_EMPTY_META = types.MappingProxyType({})
 
-logger = logging.getLogger(__name__)
+def _page_number(element: Dict[str, Any]) -> int:
+    """Get an element's page number from its metadata, defaulting to 0."""
+    return (element.get("metadata") or _EMPTY_META).get("page_number", 0)
+
+# Abbreviations common in installation manuals that end with a period mid-sentence
+_ABBREVIATIONS = frozenset({"no", "fig", "pcs", "in", "ft", "etc", "e.g", "i.e", "mm", "cm", "lb", "oz"})
+
+def _split_sentences(text: str) -> List[str]:
+    """
+    Split text into sentences with a regex tuned for installation manuals.
+    
+    Text is split at sentence endings followed by a capital letter or digit
+    and at line breaks. A sentence break right after a known abbreviation
+    ("Fig. 2", "No. 8 screws") is joined back up.
+    """
+    sentences = []
+    pending = ""
+    # parts alternates text pieces with the captured break that follows them:
+    # None after a sentence break, "\n" after a line break
+    parts = _SENT_SPLIT_RE.split(text)
+    for index in range(0, len(parts), 2):
+        piece = parts[index].strip()
+        if pending:
+            piece = f"{pending} {piece}" if piece else pending
+            pending = ""
+        if not piece:
+            continue
+        
+        sentence_break = index + 1 < len(parts) and parts[index + 1] is None
+        if (
+            sentence_break
+            and piece.endswith(".")
+            and piece.rsplit(None, 1)[-1].rstrip(".").lower() in _ABBREVIATIONS
+        ):
+            pending = piece
+            continue
+        sentences.append(piece)
+    return sentences
+
+def _tokenize_sentences(text: str, use_punkt: bool) -> Tuple[str, ...]:
+    """Split text into sentences with Punkt if requested and loadable, else the built-in splitter."""
+    tokenizer = _get_punkt("english") if use_punkt else None
+    if tokenizer is not None:
+        return tuple(tokenizer.tokenize(text))
+    return tuple(_split_sentences(text))
+
+# Boilerplate sections (safety preambles, warranty text) repeat verbatim
+# across product manuals, so their sentences are cached; whole-document
+# texts are longer than this and are split directly
+_SENTENCE_CACHE_MAX_LEN = 4096
+
+_tokenize_sentences_cached = functools.lru_cache(maxsize=4096)(_tokenize_sentences)
+
+def _pack_ranges(prefix: List[int], start: int, stop: int, budget: int) -> Iterator[tuple]:
+    """
+    Greedily pack items start..stop into runs whose summed sizes fit budget.
+    
+    prefix[i] is the total size of the items before index i. Yields
+    half-open (start, end) index ranges; every range holds at least one
+    item, so an oversized item gets a range of its own.
+    """
+    while start < stop:
+        end = bisect.bisect_right(prefix, prefix[start] + budget, start + 1, stop + 1) - 1
+        if end <= start:
+            end = start + 1
+        yield start, end
+        start = end
+
+@dataclass(slots=True)
+class Chunk:
+    """A chunk of document text with its metadata."""
+    type: str
+    text: str
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the chunk as a plain dictionary."""
+        return {"type": self.type, "text": self.text, "metadata": self.metadata}
 
 class ChunkingStrategy(ABC):
     """Base class for document chunking strategies."""
@@ -36,425 +239,297 @@ class ChunkingStrategy(ABC):
         self.config = config or get_config().document_processing
         self.chunk_size = getattr(self.config, "chunk_size", 1000)
         self.chunk_overlap = getattr(self.config, "chunk_overlap", 200)
+        self.use_nltk = getattr(self.config, "use_nltk", False)
     
     @abstractmethod
-    def create_chunks(self, document: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def create_chunks(self, document: Dict[str, Any]) -> List[Chunk]:
         """Create chunks from a document."""
         pass
     
-    def _split_text_into_sentences(self, text: str) -> List[str]:
-        """Split text into sentences using NLTK if available."""
+    def create_chunks_batch(self, documents: Iterable[Dict[str, Any]]) -> List[List[Chunk]]:
+        """Create chunks for several documents in this process, in order."""
+        create_chunks = self.create_chunks
+        return [create_chunks(document) for document in documents]
+    
+    def _join_document_text(self, document: Dict[str, Any]) -> str:
+        """Join heading, paragraph and installation step text with blank lines."""
+        parts = []
+        parts.extend(heading.get("text", "") for heading in document.get("headings", []))
+        parts.extend(paragraph.get("text", "") for paragraph in document.get("paragraphs", []))
+        parts.extend(step.get("text", "") for step in document.get("installation_steps", []))
+        return "\n\n".join(parts)
+    
+    def _split_text_into_sentences(self, text: str) -> Sequence[str]:
+        """Split text into sentences, using NLTK Punkt only if enabled in config."""
         if not text:
-            return []
-            
-        if NLTK_AVAILABLE:
-            return sent_tokenize(text)
-        else:
-            # Simple sentence splitting
-            sentences = []
-            for paragraph in text.split('\n'):
-                # Split on common sentence endings
-                for sentence in re.split(r'(?<=[.!?])\s+', paragraph):
-                    if sentence.strip():
-                        sentences.append(sentence.strip())
-            return sentences
+            return ()
+        
+        use_punkt = self.use_nltk and NLTK_AVAILABLE
+        if len(text) <= _SENTENCE_CACHE_MAX_LEN:
+            return _tokenize_sentences_cached(text, use_punkt)
+        return _tokenize_sentences(text, use_punkt)
 
 class HierarchicalChunkingStrategy(ChunkingStrategy):
     """Hierarchical chunking strategy that preserves document structure."""
     
-    def create_chunks(self, document: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def create_chunks(self, document: Dict[str, Any]) -> List[Chunk]:
         """Create hierarchical chunks from a document."""
+        doc_meta = document.get("metadata") or _EMPTY_META
         chunks = []
         
-        # Process installation steps as individual chunks or small related groups
-        chunks.extend(self._chunk_installation_steps(document.get("installation_steps", [])))
-        
-        # Process components and tools sections
-        chunks.extend(self._chunk_by_section(document.get("components", []), "component"))
-        chunks.extend(self._chunk_by_section(document.get("tools", []), "tool"))
-        
-        # Process regular paragraphs that weren't included in specialized sections
-        chunks.extend(self._chunk_paragraphs(document.get("paragraphs", [])))
-        
-        # Process tables (each table as a separate chunk)
-        for table in document.get("tables", []):
-            chunks.append({
-                "type": "table",
-                "text": table.get("text", ""),
-                "metadata": {
-                    "page_number": table.get("metadata", {}).get("page_number", 0),
-                    "content_type": "table"
-                }
-            })
-        
-        # Add document metadata to all chunks
-        for chunk in chunks:
-            if "metadata" not in chunk:
-                chunk["metadata"] = {}
-            chunk["metadata"].update(document.get("metadata", {}))
+        for chunk in itertools.chain(
+            # Process installation steps as individual chunks or small related groups
+            self._chunk_installation_steps(document.get("installation_steps", [])),
+            
+            # Process components and tools sections
+            self._chunk_by_section(document.get("components", []), "component"),
+            self._chunk_by_section(document.get("tools", []), "tool"),
+            
+            # Process regular paragraphs that weren't included in specialized sections
+            self._chunk_paragraphs(document.get("paragraphs", [])),
+            
+            # Process tables (each table as a separate chunk)
+            self._chunk_tables(document.get("tables", [])),
+        ):
+            # Add document metadata as each chunk is produced
+            chunk.metadata.update(doc_meta)
+            chunks.append(chunk)
         
         return chunks
     
-    def _chunk_installation_steps(self, steps: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _chunk_installation_steps(self, steps: List[Dict[str, Any]]) -> Iterator[Chunk]:
         """Create chunks from installation steps, preserving step integrity."""
-        chunks = []
-        current_chunk_text = []
-        current_chunk_size = 0
-        current_step_number = None
+        step_texts = [step.get("text", "") for step in steps]
         
-        for step in steps:
-            step_text = step.get("text", "")
-            
-            # Try to extract step number
-            match = re.search(r"step\s+(\d+)", step_text.lower())
+        # Step number in effect at each step, and the indexes where a new
+        # step number starts; a chunk never spans one of those boundaries
+        step_numbers = []
+        boundaries = [0]
+        current_step_number = None
+        for index, step_text in enumerate(step_texts):
+            match = _STEP_NUM_RE.search(step_text)
             if match:
                 step_number = int(match.group(1))
-                
-                # If we're on a new step and have content, create a chunk
-                if current_step_number is not None and current_step_number != step_number and current_chunk_text:
-                    chunks.append({
-                        "type": "installation_step",
-                        "text": "\n".join(current_chunk_text),
-                        "metadata": {
-                            "step_number": current_step_number,
-                            "content_type": "installation_step"
-                        }
-                    })
-                    current_chunk_text = []
-                    current_chunk_size = 0
-                
+                if current_step_number is not None and current_step_number != step_number:
+                    boundaries.append(index)
                 current_step_number = step_number
-            
-            # If adding this step would exceed the target chunk size and we already have content,
-            # create a chunk and start a new one
-            step_size = len(step_text)
-            if current_chunk_size + step_size > self.chunk_size and current_chunk_text:
-                chunks.append({
-                    "type": "installation_step",
-                    "text": "\n".join(current_chunk_text),
-                    "metadata": {
-                        "step_number": current_step_number,
+            step_numbers.append(current_step_number)
+        boundaries.append(len(step_texts))
+        
+        # Each step is counted with the newline that joins it to the next, so
+        # the budget allows for the one trailing newline a chunk does not have
+        prefix = [0, *itertools.accumulate(len(step_text) + 1 for step_text in step_texts)]
+        budget = self.chunk_size + 1
+        for section_start, section_end in itertools.pairwise(boundaries):
+            for start, end in _pack_ranges(prefix, section_start, section_end, budget):
+                # A chunk cut for size is labelled with the step number in
+                # effect at the step that starts the next chunk
+                number_index = end if end < section_end else end - 1
+                yield Chunk(
+                    type="installation_step",
+                    text="\n".join(step_texts[start:end]),
+                    metadata={
+                        "step_number": step_numbers[number_index],
                         "content_type": "installation_step"
                     }
-                })
-                current_chunk_text = []
-                current_chunk_size = 0
-            
-            current_chunk_text.append(step_text)
-            current_chunk_size += step_size
-        
-        # Add the last chunk if there's any content left
-        if current_chunk_text:
-            chunks.append({
-                "type": "installation_step",
-                "text": "\n".join(current_chunk_text),
-                "metadata": {
-                    "step_number": current_step_number,
-                    "content_type": "installation_step"
-                }
-            })
-        
-        return chunks
+                )
     
-    def _chunk_by_section(self, sections: List[Dict[str, Any]], section_type: str) -> List[Dict[str, Any]]:
+    def _chunk_by_section(self, sections: List[Dict[str, Any]], section_type: str) -> Iterator[Chunk]:
         """Create chunks from document sections."""
-        chunks = []
+        chunk_size = self.chunk_size
+        chunk_type = f"{section_type}_section"
         
         for section in sections:
             heading = section.get("heading", "")
             paragraphs = section.get("paragraphs", [])
             
+            # Metadata shared by every chunk of this section
+            base_meta = {
+                "page_number": section.get("page_number", 0),
+                "content_type": section_type,
+                "heading": heading
+            }
+            
             # Combine paragraphs into a single text
             section_text = heading + "\n\n" + "\n".join([p.get("text", "") for p in paragraphs])
             
             # If section is small enough, keep it as one chunk
-            if len(section_text) <= self.chunk_size:
-                chunks.append({
-                    "type": f"{section_type}_section",
-                    "text": section_text,
-                    "metadata": {
-                        "page_number": section.get("page_number", 0),
-                        "content_type": section_type,
-                        "heading": heading
-                    }
-                })
+            if len(section_text) <= chunk_size:
+                yield Chunk(type=chunk_type, text=section_text, metadata=base_meta)
             else:
-                # Split large sections into smaller chunks
+                # Split large sections into smaller chunks, packed straight from
+                # the sentences' prefix sums; the last chunk keeps base_meta itself
                 sentences = self._split_text_into_sentences(section_text)
-                current_chunk = []
-                current_size = 0
-                
-                for sentence in sentences:
-                    sentence_size = len(sentence)
-                    
-                    if current_size + sentence_size > self.chunk_size and current_chunk:
-                        chunks.append({
-                            "type": f"{section_type}_section",
-                            "text": " ".join(current_chunk),
-                            "metadata": {
-                                "page_number": section.get("page_number", 0),
-                                "content_type": section_type,
-                                "heading": heading
-                            }
-                        })
-                        current_chunk = []
-                        current_size = 0
-                    
-                    current_chunk.append(sentence)
-                    current_size += sentence_size
-                
-                # Add the last chunk if there's any content left
-                if current_chunk:
-                    chunks.append({
-                        "type": f"{section_type}_section",
-                        "text": " ".join(current_chunk),
-                        "metadata": {
-                            "page_number": section.get("page_number", 0),
-                            "content_type": section_type,
-                            "heading": heading
-                        }
-                    })
-        
-        return chunks
+                num_sentences = len(sentences)
+                prefix = [0, *itertools.accumulate(map(len, sentences))]
+                for start, end in _pack_ranges(prefix, 0, num_sentences, chunk_size):
+                    yield Chunk(
+                        type=chunk_type,
+                        text=" ".join(sentences[start:end]),
+                        metadata=base_meta if end == num_sentences else dict(base_meta)
+                    )
     
-    def _chunk_paragraphs(self, paragraphs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _chunk_paragraphs(self, paragraphs: List[Dict[str, Any]]) -> Iterator[Chunk]:
         """Create chunks from regular paragraphs."""
-        chunks = []
-        current_chunk = []
-        current_size = 0
-        
+        paragraph_texts = []
         for paragraph in paragraphs:
             # Skip paragraphs that might have been included in other chunks
             if paragraph.get("processed", False):
                 continue
-            
-            paragraph_text = paragraph.get("text", "")
-            paragraph_size = len(paragraph_text)
-            
-            # If adding this paragraph would exceed the chunk size and we already have content,
-            # create a chunk and start a new one
-            if current_size + paragraph_size > self.chunk_size and current_chunk:
-                chunks.append({
-                    "type": "paragraph",
-                    "text": "\n\n".join(current_chunk),
-                    "metadata": {
-                        "content_type": "general_info"
-                    }
-                })
-                current_chunk = []
-                current_size = 0
-            
-            current_chunk.append(paragraph_text)
-            current_size += paragraph_size
+            paragraph_texts.append(paragraph.get("text", ""))
             paragraph["processed"] = True
         
-        # Add the last chunk if there's any content left
-        if current_chunk:
-            chunks.append({
-                "type": "paragraph",
-                "text": "\n\n".join(current_chunk),
-                "metadata": {
+        prefix = [0, *itertools.accumulate(map(len, paragraph_texts))]
+        for start, end in _pack_ranges(prefix, 0, len(paragraph_texts), self.chunk_size):
+            yield Chunk(
+                type="paragraph",
+                text="\n\n".join(paragraph_texts[start:end]),
+                metadata={
                     "content_type": "general_info"
                 }
-            })
-        
-        return chunks
+            )
+    
+    def _chunk_tables(self, tables: List[Dict[str, Any]]) -> Iterator[Chunk]:
+        """Create one chunk per table."""
+        for table in tables:
+            yield Chunk(
+                type="table",
+                text=table.get("text", ""),
+                metadata={
+                    "page_number": _page_number(table),
+                    "content_type": "table"
+                }
+            )
 
 class SemanticChunkingStrategy(ChunkingStrategy):
     """Semantic chunking strategy that groups content by meaning."""
     
-    def create_chunks(self, document: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def create_chunks(self, document: Dict[str, Any]) -> List[Chunk]:
         """Create semantically coherent chunks from a document."""
-        # Extract all text elements
-        text_elements = []
+        # Extract all text elements as parallel lists of text and page number
+        texts = []
+        pages = []
+        
+        # Index paragraph text by page once instead of rescanning per heading
+        paras_by_page = {}
+        for p in document.get("paragraphs", []):
+            paras_by_page.setdefault(_page_number(p), []).append(p.get("text", ""))
         
         # Extract headings and their associated content
         for heading in document.get("headings", []):
             heading_text = heading.get("text", "")
-            heading_page = heading.get("metadata", {}).get("page_number", 0)
+            heading_page = _page_number(heading)
             
             # Find all paragraphs on the same page that might be under this heading
-            associated_paragraphs = [
-                p.get("text", "") for p in document.get("paragraphs", [])
-                if p.get("metadata", {}).get("page_number", 0) == heading_page
-            ]
+            associated_paragraphs = paras_by_page.get(heading_page, ())
             
             # Create a semantic unit from the heading and its paragraphs
             if associated_paragraphs:
-                text_elements.append({
-                    "text": heading_text + "\n\n" + "\n".join(associated_paragraphs),
-                    "metadata": {
-                        "page_number": heading_page,
-                        "heading": heading_text
-                    }
-                })
+                texts.append(heading_text + "\n\n" + "\n".join(associated_paragraphs))
+                pages.append(heading_page)
         
         # Extract installation steps as semantic units
         for step in document.get("installation_steps", []):
-            text_elements.append({
-                "text": step.get("text", ""),
-                "metadata": {
-                    "content_type": "installation_step",
-                    "page_number": step.get("original_element", {}).get("metadata", {}).get("page_number", 0)
-                }
-            })
+            texts.append(step.get("text", ""))
+            pages.append(_page_number(step.get("original_element") or _EMPTY_META))
         
         # Group elements by semantic similarity and create chunks
-        chunks = self._group_elements_semantically(text_elements)
-        
-        # Add document metadata to all chunks
-        for chunk in chunks:
-            if "metadata" not in chunk:
-                chunk["metadata"] = {}
-            chunk["metadata"].update(document.get("metadata", {}))
-        
-        return chunks
+        return self._group_elements_semantically(
+            texts, pages, document.get("metadata") or _EMPTY_META
+        )
     
-    def _group_elements_semantically(self, elements: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Group elements by semantic similarity."""
-        # Sort elements by page number to maintain document order
-        sorted_elements = sorted(elements, key=lambda x: x.get("metadata", {}).get("page_number", 0))
+    def _group_elements_semantically(
+        self,
+        texts: List[str],
+        pages: List[int],
+        doc_meta: Mapping[str, Any] = _EMPTY_META
+    ) -> List[Chunk]:
+        """
+        Group elements by semantic similarity, adding doc_meta to each chunk.
+        
+        Elements are given as parallel lists of their text and page number.
+        """
+        chunk_size = self.chunk_size
+        
+        # Visit elements by page number to maintain document order; the sort
+        # is stable, so elements on the same page stay in input order
+        order = sorted(range(len(texts)), key=pages.__getitem__)
         
         chunks = []
-        current_chunk = []
-        current_chunk_text = ""
+        current_chunk_parts = []
+        current_chunk_len = 0
         current_topic = None
         
-        for element in sorted_elements:
-            element_text = element.get("text", "")
-            element_metadata = element.get("metadata", {})
+        def emit_chunk(text):
+            chunks.append(Chunk(
+                type="semantic_section",
+                text=text,
+                metadata={
+                    "content_type": current_topic,
+                    **doc_meta
+                }
+            ))
+        
+        for index in order:
+            element_text = texts[index]
             
             # Determine the topic of this element
             topic = self._determine_topic(element_text)
             
             # If this is a new topic and we have content, create a chunk
-            if current_topic is not None and topic != current_topic and current_chunk:
-                chunks.append({
-                    "type": "semantic_section",
-                    "text": current_chunk_text,
-                    "metadata": {
-                        "content_type": current_topic
-                    }
-                })
-                current_chunk = []
-                current_chunk_text = ""
+            if current_topic is not None and topic != current_topic and current_chunk_parts:
+                emit_chunk("\n\n".join(current_chunk_parts))
+                current_chunk_parts = []
+                current_chunk_len = 0
             
             # If adding this element would exceed the chunk size and we already have content,
             # create a chunk and start a new one
-            if len(current_chunk_text) + len(element_text) > self.chunk_size and current_chunk:
-                chunks.append({
-                    "type": "semantic_section",
-                    "text": current_chunk_text,
-                    "metadata": {
-                        "content_type": current_topic
-                    }
-                })
-                current_chunk = []
-                current_chunk_text = ""
+            if current_chunk_len + len(element_text) > chunk_size and current_chunk_parts:
+                emit_chunk("\n\n".join(current_chunk_parts))
+                current_chunk_parts = []
+                current_chunk_len = 0
             
-            current_chunk.append(element)
-            current_chunk_text += (element_text + "\n\n")
+            current_chunk_parts.append(element_text)
+            current_chunk_len += len(element_text) + 2
             current_topic = topic
         
         # Add the last chunk if there's any content left
-        if current_chunk:
-            chunks.append({
-                "type": "semantic_section",
-                "text": current_chunk_text.strip(),
-                "metadata": {
-                    "content_type": current_topic
-                }
-            })
+        if current_chunk_parts:
+            emit_chunk("\n\n".join(current_chunk_parts).strip())
         
         return chunks
     
     def _determine_topic(self, text: str) -> str:
         """Determine the topic of a text element."""
-        text_lower = text.lower()
-        
-        # Check for installation steps
-        if re.search(r"step\s+\d+", text_lower) or "install" in text_lower:
-            return "installation_step"
-        
-        # Check for tool information
-        if "tool" in text_lower or "equipment" in text_lower:
-            return "tool"
-        
-        # Check for component information
-        if "component" in text_lower or "part" in text_lower or "hardware" in text_lower:
-            return "component"
-        
-        # Check for door type information
-        if "door type" in text_lower or "door model" in text_lower:
-            return "door_type"
-        
-        # Check for safety information
-        if "safety" in text_lower or "warning" in text_lower or "caution" in text_lower:
-            return "safety"
-        
-        # Default to general information
-        return "general_info"
+        if len(text) <= _TOPIC_CACHE_MAX_LEN:
+            return _determine_topic_cached(text)
+        return _scan_topic(text)
 
 class FixedSizeChunkingStrategy(ChunkingStrategy):
     """Fixed-size chunking strategy that creates chunks of a specified size."""
     
-    def create_chunks(self, document: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def create_chunks(self, document: Dict[str, Any]) -> List[Chunk]:
         """Create fixed-size chunks from a document."""
-        # Extract all text from the document
-        all_text = ""
-        
-        # Add headings
-        for heading in document.get("headings", []):
-            all_text += heading.get("text", "") + "\n\n"
-        
-        # Add paragraphs
-        for paragraph in document.get("paragraphs", []):
-            all_text += paragraph.get("text", "") + "\n\n"
+        doc_meta = document.get("metadata") or _EMPTY_META
         
-        # Add installation steps
-        for step in document.get("installation_steps", []):
-            all_text += step.get("text", "") + "\n\n"
+        # Extract all text from the document
+        all_text = self._join_document_text(document)
         
-        # Create fixed-size chunks
-        chunks = []
+        # Pack sentences into chunks straight from their prefix sums, so no
+        # per-chunk sentence buffer is built
         sentences = self._split_text_into_sentences(all_text)
-        current_chunk = []
-        current_size = 0
-        
-        for sentence in sentences:
-            sentence_size = len(sentence)
-            
-            if current_size + sentence_size > self.chunk_size and current_chunk:
-                chunks.append({
-                    "type": "fixed_chunk",
-                    "text": " ".join(current_chunk),
-                    "metadata": {
-                        "content_type": "general_info"
-                    }
-                })
-                current_chunk = []
-                current_size = 0
-            
-            current_chunk.append(sentence)
-            current_size += sentence_size
-        
-        # Add the last chunk if there's any content left
-        if current_chunk:
-            chunks.append({
-                "type": "fixed_chunk",
-                "text": " ".join(current_chunk),
-                "metadata": {
-                    "content_type": "general_info"
+        prefix = [0, *itertools.accumulate(map(len, sentences))]
+        return [
+            Chunk(
+                type="fixed_chunk",
+                text=" ".join(sentences[start:end]),
+                metadata={
+                    "content_type": "general_info",
+                    **doc_meta
                 }
-            })
-        
-        # Add document metadata to all chunks
-        for chunk in chunks:
-            if "metadata" not in chunk:
-                chunk["metadata"] = {}
-            chunk["metadata"].update(document.get("metadata", {}))
-        
-        return chunks
+            )
+            for start, end in _pack_ranges(prefix, 0, len(sentences), self.chunk_size)
+        ]
 
 class SlidingWindowChunkingStrategy(ChunkingStrategy):
     """
@@ -462,22 +537,14 @@ class SlidingWindowChunkingStrategy(ChunkingStrategy):
     This strategy helps maintain context between chunks.
     """
     
-    def create_chunks(self, document: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def create_chunks(self, document: Dict[str, Any]) -> List[Chunk]:
         """Create chunks using a sliding window approach."""
-        # Extract all text from the document
-        all_text = ""
+        chunk_size = self.chunk_size
+        chunk_overlap = self.chunk_overlap
+        doc_meta = document.get("metadata") or _EMPTY_META
         
-        # Add headings
-        for heading in document.get("headings", []):
-            all_text += heading.get("text", "") + "\n\n"
-        
-        # Add paragraphs
-        for paragraph in document.get("paragraphs", []):
-            all_text += paragraph.get("text", "") + "\n\n"
-        
-        # Add installation steps
-        for step in document.get("installation_steps", []):
-            all_text += step.get("text", "") + "\n\n"
+        # Extract all text from the document
+        all_text = self._join_document_text(document)
         
         # Split text into sentences
         sentences = self._split_text_into_sentences(all_text)
@@ -488,73 +555,158 @@ class SlidingWindowChunkingStrategy(ChunkingStrategy):
         # Handle edge case of very short text
         if len(sentences) == 0:
             return []
-        elif len(all_text) <= self.chunk_size:
-            chunks.append({
-                "type": "sliding_window_chunk",
-                "text": all_text,
-                "metadata": {
+        elif len(all_text) <= chunk_size:
+            chunks.append(Chunk(
+                type="sliding_window_chunk",
+                text=all_text,
+                metadata={
                     "content_type": "general_info",
-                    "chunk_index": 0
+                    "chunk_index": 0,
+                    **doc_meta
                 }
-            })
+            ))
             
         else:
-            # Calculate number of sentences per chunk based on avg sentence length
-            avg_sent_len = len(all_text) / len(sentences)
-            approx_sents_per_chunk = max(1, int(self.chunk_size / avg_sent_len))
-            overlap_sents = max(1, int(self.chunk_overlap / avg_sent_len))
+            def emit_chunk(text):
+                chunks.append(Chunk(
+                    type="sliding_window_chunk",
+                    text=text,
+                    metadata={
+                        "content_type": "general_info",
+                        "chunk_index": len(chunks),
+                        **doc_meta
+                    }
+                ))
             
-            # Create chunks
-            for i in range(0, len(sentences), approx_sents_per_chunk - overlap_sents):
-                end_idx = min(i + approx_sents_per_chunk, len(sentences))
-                chunk_text = " ".join(sentences[i:end_idx])
+            # Prefix sums of sentence lengths, each plus its joining space, so the
+            # joined length of sentences[i:j] is cum[j - 1] - cum[i - 1] - 1
+            cum = list(itertools.accumulate(len(sentence) + 1 for sentence in sentences))
+            num_sentences = len(sentences)
+            start = 0
+            
+            while start < num_sentences:
+                # Extend the window to the last sentence that keeps it within chunk_size
+                base = cum[start - 1] if start else 0
+                end = bisect.bisect_right(cum, base + chunk_size + 1, start)
+                
+                if end == start:
+                    # A single sentence longer than chunk_size is split by characters
+                    sentence = sentences[start]
+                    for j in range(0, len(sentence), max(1, chunk_size - chunk_overlap)):
+                        emit_chunk(sentence[j:j + chunk_size])
+                    start += 1
+                    continue
                 
-                # Check if chunk is too large and needs splitting
-                if len(chunk_text) > self.chunk_size * 1.5:
-                    # Simple character-based split as a fallback
-                    for j in range(0, len(chunk_text), self.chunk_size - self.chunk_overlap):
-                        sub_chunk = chunk_text[j:j + self.chunk_size]
-                        if sub_chunk:
-                            chunks.append({
-                                "type": "sliding_window_chunk",
-                                "text": sub_chunk,
-                                "metadata": {
-                                    "content_type": "general_info",
-                                    "chunk_index": len(chunks)
-                                }
-                            })
-                else:
-                    chunks.append({
-                        "type": "sliding_window_chunk",
-                        "text": chunk_text,
-                        "metadata": {
-                            "content_type": "general_info",
-                            "chunk_index": len(chunks)
-                        }
-                    })
+                emit_chunk(" ".join(sentences[start:end]))
                 
                 # Stop if we've reached the end
-                if end_idx >= len(sentences):
+                if end >= num_sentences:
                     break
-        
-        # Add document metadata to all chunks
-        for chunk in chunks:
-            chunk["metadata"].update(document.get("metadata", {}))
+                
+                # Start the next window at the first sentence within chunk_overlap
+                # characters of this window's end
+                next_start = bisect.bisect_left(cum, cum[end - 1] - chunk_overlap, start) + 1
+                start = max(next_start, start + 1)
         
         return chunks
 
+# Strategy classes by configuration name
+_STRATEGY_MAP = {
+    "hierarchical": HierarchicalChunkingStrategy,
+    "semantic": SemanticChunkingStrategy,
+    "fixed": FixedSizeChunkingStrategy,
+    "sliding_window": SlidingWindowChunkingStrategy
+}
+
+@functools.lru_cache(maxsize=None)
+def _default_strategy(strategy_name: str) -> ChunkingStrategy:
+    """Get the shared strategy instance built from the global config."""
+    return _STRATEGY_MAP[strategy_name](None)
+
 # Factory function to get the appropriate chunking strategy
 def get_chunking_strategy(strategy_name: str, config=None) -> ChunkingStrategy:
-    """Get the appropriate chunking strategy based on the strategy name."""
-    strategies = {
-        "hierarchical": HierarchicalChunkingStrategy,
-        "semantic": SemanticChunkingStrategy,
-        "fixed": FixedSizeChunkingStrategy,
-        "sliding_window": SlidingWindowChunkingStrategy
-    }
-    
-    if strategy_name not in strategies:
-        logger.warning(f"Unknown chunking strategy: {strategy_name}. Using hierarchical strategy.")
-        return HierarchicalChunkingStrategy(config)
-    
-    return strategies[strategy_name](config)
\ No newline at end of file
+    """
+    Get the appropriate chunking strategy based on the strategy name.
+    
+    Strategies hold no per-document state, so those built from the global
+    config are created once and shared between callers.
+    """
+    if strategy_name not in _STRATEGY_MAP:
+        logger.warning("Unknown chunking strategy: %s. Using hierarchical strategy.", strategy_name)
+        strategy_name = "hierarchical"
+    
+    if config is None:
+        return _default_strategy(strategy_name)
+    return _STRATEGY_MAP[strategy_name](config)
+
+# Strategy set once per worker process by _init_worker or _set_worker_strategy
+_worker_strategy: Optional[ChunkingStrategy] = None
+
+def _init_worker(strategy_name: str, config) -> None:
+    """Build the chunking strategy for this worker process."""
+    global _worker_strategy
+    _worker_strategy = get_chunking_strategy(strategy_name, config)
+
+def _set_worker_strategy(strategy: ChunkingStrategy) -> None:
+    """Install a strategy unpickled from the parent in this worker process."""
+    global _worker_strategy
+    _worker_strategy = strategy
+
+def _worker_create_chunks(document: Dict[str, Any]) -> List[Chunk]:
+    """Chunk one document with this worker's strategy."""
+    return _worker_strategy.create_chunks(document)
+
+def chunk_documents(
+    documents: List[Dict[str, Any]],
+    strategy_name: str,
+    config=None,
+    workers: Optional[int] = None
+) -> List[List[Chunk]]:
+    """
+    Chunk documents in parallel across worker processes.
+    
+    Chunking is pure CPU work on independent documents, so a process pool
+    sidesteps the GIL. Each worker builds its strategy once; only documents
+    and chunks cross the process boundary. Documents are chunked from
+    pickled copies, so flags the strategies set on input elements are not
+    visible to the caller.
+    
+    Args:
+        documents: Organized documents to chunk.
+        strategy_name: Chunking strategy name.
+        config: Document processing config. If None, the global config is used.
+        workers: Number of worker processes. If None, one per CPU.
+        
+    Returns:
+        Chunks for each document, in input order.
+    """
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(strategy_name, config)
+    ) as executor:
+        return list(executor.map(_worker_create_chunks, documents, chunksize=16))
+
+def create_chunks_parallel(
+    strategy: ChunkingStrategy,
+    documents: List[Dict[str, Any]],
+    workers: Optional[int] = None
+) -> List[List[Chunk]]:
+    """
+    Chunk documents in parallel with an existing strategy instance.
+    
+    Like chunk_documents, but the strategy is pickled once into each worker
+    instead of being built there by name, so custom strategy subclasses
+    and instances with adjusted settings can be used. The strategy and its
+    config must be picklable.
+    
+    Args:
+        strategy: Chunking strategy to run in every worker.
+        documents: Organized documents to chunk.
+        workers: Number of worker processes. If None, one per CPU.
+        
+    Returns:
+        Chunks for each document, in input order.
+    """
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_set_worker_strategy, initargs=(strategy,)
+    ) as executor:
+        return list(executor.map(_worker_create_chunks, documents, chunksize=16))
@@ -5,28 +5,273 @@ Handles PDF extraction, structure identification, and chunk creation.
 
 import os
 import logging
+import importlib.util
+import re
 import asyncio
-from typing import List, Dict, Any, Optional, Tuple, Union
+import functools
+import multiprocessing
+import tempfile
+import threading
+from typing import List, Dict, Any, Optional, Tuple, Union, Callable
 from abc import ABC, abstractmethod
-from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from itertools import repeat
 
-# Import PDF processing libraries conditionally to handle potential import errors
+# Unstructured's partitioners pull in the PDF and layout model stack, so they
+# are imported where they are used; only their availability is checked here
+UNSTRUCTURED_AVAILABLE = importlib.util.find_spec("unstructured") is not None
+if not UNSTRUCTURED_AVAILABLE:
+    logging.warning("Unstructured library not available. PDF processing will be limited.")
+
+# Import the Aho-Corasick matcher conditionally; door keyword detection falls back to a regex scan
 try:
-    from unstructured.partition.pdf import partition_pdf
-    from unstructured.partition.html import partition_html
-    from unstructured.staging.base import convert_to_dict, convert_to_isd
-    UNSTRUCTURED_AVAILABLE = True
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
 except ImportError:
-    UNSTRUCTURED_AVAILABLE = False
-    logging.warning("Unstructured library not available. PDF processing will be limited.")
+    AHOCORASICK_AVAILABLE = False
 
 from config.app_config import get_config
-from data_processing.chunking_strategies import get_chunking_strategy
-from data_processing.embedding_generator import EmbeddingGenerator, MockEmbeddingGenerator
+from data_processing.chunking_strategies import Chunk, get_chunking_strategy
+from data_processing.embedding_generator import (
+    BaseEmbeddingGenerator,
+    CachedEmbeddingGenerator,
+    EmbeddingGenerator,
+    MockEmbeddingGenerator,
+)
 
 logger = logging.getLogger(__name__)
 
+# Thread pool shared by all async document processing; threads are started
+# on first use and reused instead of being created for every document
+_document_executor = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="doc-process")
+
+def _element_record(element: Any) -> Dict[str, Any]:
+    """
+    Get an unstructured element's type, text and page number as a dict.
+    
+    Nothing downstream reads other element fields, so the rest of the
+    element metadata is not serialized. As in unstructured's own dicts, a
+    missing page number is left out rather than stored as None.
+    """
+    page_number = element.metadata.page_number
+    return {
+        "type": element.category,
+        "text": element.text,
+        "metadata": {} if page_number is None else {"page_number": page_number},
+    }
+
+def _pdf_partition_kwargs(config) -> Dict[str, Any]:
+    """
+    Get the partition_pdf arguments for whole-file and page-range calls.
+    
+    The defaults match unstructured's auto strategy with image and table
+    extraction, which loads the layout models; text-only corpora can set
+    pdf_strategy to fast and turn the extraction flags off.
+    """
+    infer_tables = getattr(config, "pdf_infer_table_structure", True)
+    return {
+        "strategy": getattr(config, "pdf_strategy", "auto"),
+        "extract_images": getattr(config, "pdf_extract_images", True),
+        "extract_tables": infer_tables,
+        "infer_table_structure": infer_tables,
+    }
+
+# List items that mention one of these verbs are treated as installation steps
+_ACTION_VERB_RE = re.compile(
+    "install|place|position|secure|attach|connect|align|adjust", re.IGNORECASE
+)
+# Paragraphs that start with a number followed by a period
+_NUMBERED_ITEM_RE = re.compile(r"\d+\.")
+# Mention of a step anywhere in a chunk's text, matched without a lowercased copy
+_STEP_MENTION_RE = re.compile("step ", re.IGNORECASE)
+# Step number patterns tried in order when enriching step chunks
+_STEP_NUMBER_PATTERNS = (
+    re.compile(r"Step\s+(\d+)", re.IGNORECASE),  # Step 1, Step 1:
+    re.compile(r"^(\d+)\.\s+"),                # 1.
+)
+
+# Heading keywords that mark component and tool sections
+_COMPONENT_HEADING_RE = re.compile("component|part|hardware|material|item", re.IGNORECASE)
+_TOOL_HEADING_RE = re.compile("tool|equipment|required|need", re.IGNORECASE)
+
+# Door categories and types in priority order; the first one named in a text wins
+_DOOR_CATEGORIES = ("interior", "exterior")
+_DOOR_TYPES = ("bifold", "prehung", "dentil shelf", "entry door", "patio door")
+
+# Door keyword -> (0 for a category or 1 for a type, priority, keyword)
+_DOOR_KEYWORDS = {
+    **{keyword: (0, priority, keyword) for priority, keyword in enumerate(_DOOR_CATEGORIES)},
+    **{keyword: (1, priority, keyword) for priority, keyword in enumerate(_DOOR_TYPES)},
+}
+
+def _build_door_automaton():
+    """Build an automaton mapping each door keyword to its _DOOR_KEYWORDS entry."""
+    automaton = ahocorasick.Automaton()
+    for keyword, value in _DOOR_KEYWORDS.items():
+        automaton.add_word(keyword, value)
+    automaton.make_automaton()
+    return automaton
+
+_DOOR_AUTOMATON = _build_door_automaton() if AHOCORASICK_AVAILABLE else None
+
+# Fallback scan without the automaton; case is ignored so the text needs no lowercased copy
+_DOOR_KEYWORD_RE = re.compile(
+    "|".join(re.escape(keyword) for keyword in _DOOR_KEYWORDS), re.IGNORECASE
+)
+
+def _scan_door_keywords(text: str) -> Tuple[str, str]:
+    """Find the door category and door type named in a text in one pass."""
+    if _DOOR_AUTOMATON is not None:
+        matches = (value for _, value in _DOOR_AUTOMATON.iter(text.lower()))
+    else:
+        matches = (_DOOR_KEYWORDS[match.group().lower()] for match in _DOOR_KEYWORD_RE.finditer(text))
+    
+    # Best (priority, keyword) found so far for the category and for the type
+    best = [(len(_DOOR_CATEGORIES), "unknown"), (len(_DOOR_TYPES), "unknown")]
+    for kind, priority, keyword in matches:
+        if priority < best[kind][0]:
+            best[kind] = (priority, keyword)
+            if best[0][0] == 0 and best[1][0] == 0:
+                break
+    return best[0][1], best[1][1]
+
+@functools.lru_cache(maxsize=None)
+def _element_bucket(element_type: str) -> Tuple[str, bool]:
+    """Get the organized-document bucket for an element type, and whether it is an image type."""
+    element_type_lower = element_type.lower()
+    if "title" in element_type_lower or "heading" in element_type_lower:
+        bucket = "headings"
+    elif "table" in element_type_lower:
+        bucket = "tables"
+    elif "image" in element_type_lower:
+        bucket = "images"
+    elif "list" in element_type_lower:
+        bucket = "lists"
+    else:
+        bucket = "paragraphs"
+    return bucket, "image" in element_type_lower
+
+@functools.lru_cache(maxsize=None)
+def _chunk_type_traits(chunk_type: str) -> Tuple[bool, Optional[str]]:
+    """Get whether a chunk type marks installation steps, and the content type it implies."""
+    chunk_type_lower = chunk_type.lower()
+    if "tool" in chunk_type_lower:
+        content_type = "tools"
+    elif "component" in chunk_type_lower:
+        content_type = "components"
+    else:
+        content_type = None
+    return "installation_step" in chunk_type_lower, content_type
+
+def _pdf_page_count(file_path: str) -> int:
+    """Get the number of pages in a PDF."""
+    from PyPDF2 import PdfReader
+    return len(PdfReader(file_path).pages)
+
+def _partition_page_range(
+    file_path: str,
+    start: int,
+    stop: int,
+    partition_kwargs: Dict[str, Any]
+) -> List[Any]:
+    """
+    Partition pages start..stop (0-based, end exclusive) of a PDF.
+    
+    The pages are copied to a temporary PDF and partitioned there, then the
+    elements' page numbers and file names are mapped back to the original.
+    """
+    from PyPDF2 import PdfReader, PdfWriter
+    from unstructured.partition.pdf import partition_pdf
+    
+    reader = PdfReader(file_path)
+    writer = PdfWriter()
+    for page in reader.pages[start:stop]:
+        writer.add_page(page)
+    
+    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as page_file:
+        writer.write(page_file)
+    try:
+        elements = partition_pdf(page_file.name, **partition_kwargs)
+    finally:
+        os.unlink(page_file.name)
+    
+    file_name = os.path.basename(file_path)
+    file_directory = os.path.dirname(file_path)
+    for element in elements:
+        element_metadata = element.metadata
+        if element_metadata.page_number is not None:
+            element_metadata.page_number += start
+        element_metadata.filename = file_name
+        element_metadata.file_directory = file_directory
+    return elements
+
+def _partition_pdf_split(
+    file_path: str,
+    page_count: int,
+    partition_kwargs: Dict[str, Any],
+    workers: Optional[int] = None
+) -> List[Any]:
+    """Partition a PDF as contiguous page ranges in worker processes, keeping page order."""
+    workers = workers or os.cpu_count() or 1
+    pages_per_range = -(-page_count // workers)
+    starts = range(0, page_count, pages_per_range)
+    stops = [min(start + pages_per_range, page_count) for start in starts]
+    logger.info("Partitioning %s pages of %s in %s page ranges", page_count, file_path, len(stops))
+    
+    elements = []
+    with ProcessPoolExecutor(
+        max_workers=len(stops), mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        for range_elements in executor.map(
+            _partition_page_range, repeat(file_path), starts, stops, repeat(partition_kwargs)
+        ):
+            elements.extend(range_elements)
+    return elements
+
+def _split_file_name(file_path: str) -> Tuple[str, str]:
+    """Get a path's file name and lowercased extension without building a Path."""
+    file_name = os.path.basename(file_path)
+    return file_name, os.path.splitext(file_name)[1].lower()
+
+def _build_embedding_generator(config) -> BaseEmbeddingGenerator:
+    """Create an embedding generator based on config or environment"""
+    # Use mock embeddings if specified in config or environment variables
+    use_mock = os.environ.get("USE_MOCK_EMBEDDINGS", "").lower() == "true"
+    if use_mock or getattr(config, "use_mock_embeddings", False):
+        return MockEmbeddingGenerator()
+    
+    # Cache real embeddings on disk by text content when configured
+    generator = EmbeddingGenerator()
+    cache_path = getattr(generator.config, "cache_path", None)
+    if cache_path:
+        return CachedEmbeddingGenerator(generator, cache_path)
+    return generator
+
+@functools.lru_cache(maxsize=1)
+def _shared_embedding_generator() -> BaseEmbeddingGenerator:
+    """
+    Get the embedding generator shared across the process.
+    
+    Building a generator can load a model or open the embedding cache, so
+    batch calls and the shared processors reuse this one.
+    """
+    return _build_embedding_generator(get_config().document_processing)
+
+def _assign_embeddings(generator: BaseEmbeddingGenerator, chunks: List[Dict[str, Any]]) -> None:
+    """
+    Add an embedding to each chunk with one batched generator call.
+    
+    Manuals repeat boilerplate chunks verbatim, so each distinct text is
+    embedded once and its vector shared by every chunk with that text.
+    """
+    # Map each distinct text to its position in the batch, in first-seen order
+    text_index = {}
+    chunk_rows = [text_index.setdefault(chunk["text"], len(text_index)) for chunk in chunks]
+    
+    embeddings = generator.generate_embeddings_batch(list(text_index))
+    for chunk, row in zip(chunks, chunk_rows):
+        chunk["embedding"] = embeddings[row]
+
 class DocumentProcessor(ABC):
     """Base document processor class."""
     
@@ -34,36 +279,57 @@ class DocumentProcessor(ABC):
         # Allow dependency injection or use global config
         self.config = config or get_config().document_processing
         self.chunking_strategy = chunking_strategy or get_chunking_strategy(self.config.chunk_strategy)
-        self.embedding_generator = embedding_generator or self._create_embedding_generator()
+        # Created on first use, so processors that never embed (batch
+        # workers run with embed=False) load no model or cache
+        self._embedding_generator = embedding_generator
+        self._embedding_generator_lock = threading.Lock()
+    
+    @property
+    def embedding_generator(self) -> BaseEmbeddingGenerator:
+        """The embedding generator, created on first access."""
+        if self._embedding_generator is None:
+            with self._embedding_generator_lock:
+                if self._embedding_generator is None:
+                    self._embedding_generator = self._create_embedding_generator()
+        return self._embedding_generator
+    
+    @embedding_generator.setter
+    def embedding_generator(self, generator: BaseEmbeddingGenerator) -> None:
+        self._embedding_generator = generator
     
     def _create_embedding_generator(self):
         """Create an embedding generator based on config or environment"""
-        # Use mock embeddings if specified in config or environment variables
-        use_mock = os.environ.get("USE_MOCK_EMBEDDINGS", "").lower() == "true"
-        if use_mock or getattr(self.config, "use_mock_embeddings", False):
-            return MockEmbeddingGenerator()
-        return EmbeddingGenerator()
+        # Processors on the global config share the process-wide generator
+        if self.config is get_config().document_processing:
+            return _shared_embedding_generator()
+        return _build_embedding_generator(self.config)
+    
+    def _embed_chunks(self, chunks: List[Dict[str, Any]]) -> None:
+        """Add an embedding to each chunk with one batched generator call."""
+        _assign_embeddings(self.embedding_generator, chunks)
     
     @abstractmethod
-    def process_document(self, file_path: str) -> List[Dict[str, Any]]:
-        """Process a document and return chunks with metadata."""
+    def process_document(self, file_path: str, embed: bool = True) -> List[Dict[str, Any]]:
+        """
+        Process a document and return chunks with metadata.
+        
+        With embed=False the chunks are returned without embeddings, for
+        callers that embed many documents' chunks in one batch.
+        """
         pass
     
-    async def process_document_async(self, file_path: str) -> List[Dict[str, Any]]:
+    async def process_document_async(self, file_path: str, embed: bool = True) -> List[Dict[str, Any]]:
         """Process a document asynchronously."""
-        # Run synchronous processing in a thread pool
-        loop = asyncio.get_event_loop()
-        with ThreadPoolExecutor() as pool:
-            return await loop.run_in_executor(pool, self.process_document, file_path)
+        # Run synchronous processing in the shared thread pool
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_document_executor, self.process_document, file_path, embed)
     
     def extract_metadata(self, file_path: str, content: Any) -> Dict[str, Any]:
         """Extract metadata from a document."""
-        file_name = Path(file_path).name
-        file_type = Path(file_path).suffix.lower()
+        file_name, file_type = _split_file_name(file_path)
         
         # Determine door category and type from filename or content
-        door_category = self._extract_door_category(file_name, content)
-        door_type = self._extract_door_type(file_name, content)
+        door_category, door_type = self._extract_door_info(file_name, content)
         
         return {
             "file_path": file_path,
@@ -73,56 +339,39 @@ class DocumentProcessor(ABC):
             "door_type": door_type,
         }
     
-    def _extract_door_category(self, file_name: str, content: Any) -> str:
-        """Extract door category (interior or exterior) from filename or content."""
-        file_name_lower = file_name.lower()
+    def _extract_door_info(self, file_name: str, content: Any) -> Tuple[str, str]:
+        """
+        Extract door category and door type from filename or content.
         
-        if "interior" in file_name_lower:
-            return "interior"
-        elif "exterior" in file_name_lower:
-            return "exterior"
+        Each is taken from the filename when it names one, otherwise from
+        the content, which is scanned at most once for both.
+        """
+        door_category, door_type = _scan_door_keywords(file_name)
         
         # If not found in filename, try to find in content
-        if isinstance(content, str):
-            if "interior" in content.lower():
-                return "interior"
-            elif "exterior" in content.lower():
-                return "exterior"
-        
-        # Default to unknown if can't determine
-        return "unknown"
+        if "unknown" in (door_category, door_type) and isinstance(content, str):
+            content_category, content_type = _scan_door_keywords(content)
+            if door_category == "unknown":
+                door_category = content_category
+            if door_type == "unknown":
+                door_type = content_type
+        
+        return door_category, door_type
+    
+    def _extract_door_category(self, file_name: str, content: Any) -> str:
+        """Extract door category (interior or exterior) from filename or content."""
+        return self._extract_door_info(file_name, content)[0]
     
     def _extract_door_type(self, file_name: str, content: Any) -> str:
         """Extract door type from filename or content."""
-        file_name_lower = file_name.lower()
-        door_types = {
-            "interior": ["bifold", "prehung"],
-            "exterior": ["dentil shelf", "entry door", "patio door"]
-        }
-        
-        # Check filename for door type
-        for category, types in door_types.items():
-            for door_type in types:
-                if door_type.lower() in file_name_lower:
-                    return door_type
-        
-        # Check content for door type if string
-        if isinstance(content, str):
-            content_lower = content.lower()
-            for category, types in door_types.items():
-                for door_type in types:
-                    if door_type.lower() in content_lower:
-                        return door_type
-        
-        # Default to unknown if can't determine
-        return "unknown"
+        return self._extract_door_info(file_name, content)[1]
 
 class PDFDocumentProcessor(DocumentProcessor):
     """Processor for PDF documents."""
     
-    def process_document(self, file_path: str) -> List[Dict[str, Any]]:
+    def process_document(self, file_path: str, embed: bool = True) -> List[Dict[str, Any]]:
         """Process a PDF document and return chunks with metadata."""
-        logger.info(f"Processing PDF document: {file_path}")
+        logger.info("Processing PDF document: %s", file_path)
         
         if not UNSTRUCTURED_AVAILABLE:
             raise ImportError(
@@ -132,12 +381,7 @@ class PDFDocumentProcessor(DocumentProcessor):
         
         try:
             # Extract elements from PDF using Unstructured
-            elements = partition_pdf(
-                file_path,
-                extract_images=True,
-                extract_tables=True,
-                infer_table_structure=True,
-            )
+            elements = self._partition_pdf(file_path)
             
             # Convert elements to dictionary for easier processing
 
@@ -146,12 +390,13 @@ class PDFDocumentProcessor(DocumentProcessor):
             if not isinstance(elements, list):
                 elements = [elements]
 
-            # Convert all elements to a list of dictionaries at once
-            elements_dict = convert_to_isd(elements)
-
+            # Convert elements to dictionaries holding only the fields used downstream,
+            # then drop the partitioned elements so they are freed before chunking
+            elements_dict = [_element_record(element) for element in elements]
+            del elements
             
             # Extract text and combine it for metadata extraction
-            combined_text = " ".join([e.get("text", "") for e in elements_dict if "text" in e])
+            combined_text = " ".join([e["text"] for e in elements_dict])
             
             # Extract metadata
             metadata = self.extract_metadata(file_path, combined_text)
@@ -165,17 +410,40 @@ class PDFDocumentProcessor(DocumentProcessor):
             # Enrich chunks with procedural context
             enriched_chunks = self._enrich_chunks_with_context(chunks, metadata)
             
-            # Generate embeddings for each chunk
-            for chunk in enriched_chunks:
-                chunk["embedding"] = self.embedding_generator.generate_embedding(chunk["text"])
+            # Generate embeddings for all chunks in batches
+            if embed:
+                self._embed_chunks(enriched_chunks)
             
-            logger.info(f"Successfully processed document {file_path} into {len(enriched_chunks)} chunks")
+            logger.info("Successfully processed document %s into %s chunks", file_path, len(enriched_chunks))
             return enriched_chunks
             
         except Exception as e:
-            logger.error(f"Error processing PDF document {file_path}: {str(e)}")
+            logger.error("Error processing PDF document %s: %s", file_path, e)
             raise
     
+    def _partition_pdf(self, file_path: str) -> List[Any]:
+        """
+        Partition a PDF with an approach picked from its page count.
+        
+        With adaptive_pdf_strategy, small PDFs use the fast text-only strategy
+        and skip loading the layout models. With split_pdf_pages, large PDFs
+        are partitioned as page ranges in parallel. Everything else takes a
+        single pass with the configured strategy and extraction flags.
+        """
+        from unstructured.partition.pdf import partition_pdf
+        
+        split_pages = getattr(self.config, "split_pdf_pages", False)
+        adaptive = getattr(self.config, "adaptive_pdf_strategy", False)
+        if split_pages or adaptive:
+            page_count = _pdf_page_count(file_path)
+            if adaptive and page_count <= self.config.fast_pdf_max_pages:
+                return partition_pdf(file_path, strategy="fast")
+            if split_pages and page_count >= self.config.split_pdf_min_pages:
+                return _partition_pdf_split(
+                    file_path, page_count, _pdf_partition_kwargs(self.config), self.config.split_pdf_workers
+                )
+        return partition_pdf(file_path, **_pdf_partition_kwargs(self.config))
+    
     def _organize_elements(self, elements: List[Dict[str, Any]], metadata: Dict[str, Any]) -> Dict[str, Any]:
         """Organize document elements into a structured format."""
         # Group elements by type and position
@@ -184,33 +452,51 @@ class PDFDocumentProcessor(DocumentProcessor):
         tables = []
         images = []
         lists = []
+        buckets = {
+            "paragraphs": paragraphs,
+            "headings": headings,
+            "tables": tables,
+            "images": images,
+            "lists": lists,
+        }
+        
+        # Installation step candidates and the paragraph page index are
+        # collected in the same pass that categorizes the elements
+        step_paragraphs = []
+        action_items = []
+        numbered_paragraphs = []
+        paragraphs_by_page = {}
         
         for element in elements:
-            element_type = element.get("type", "")
             element_text = element.get("text", "")
+            bucket, is_image = _element_bucket(element.get("type", ""))
             
             # Skip empty elements
-            if not element_text and "image" not in element_type.lower():
+            if not element_text and not is_image:
                 continue
             
             # Categorize element by type
-            if "title" in element_type.lower() or "heading" in element_type.lower():
-                headings.append(element)
-            elif "table" in element_type.lower():
-                tables.append(element)
-            elif "image" in element_type.lower():
-                images.append(element)
-            elif "list" in element_type.lower():
-                lists.append(element)
-            else:
-                paragraphs.append(element)
+            buckets[bucket].append(element)
+            
+            if bucket == "paragraphs":
+                stripped_text = element_text.strip()
+                # Numbered paragraphs (Step 1, Step 2, etc.)
+                if stripped_text[:5].lower() == "step ":
+                    step_paragraphs.append(element)
+                # Paragraphs that start with a number followed by period
+                elif _NUMBERED_ITEM_RE.match(stripped_text):
+                    numbered_paragraphs.append(element)
+                paragraphs_by_page.setdefault(element.get("metadata", {}).get("page_number", 0), []).append(element)
+            elif bucket == "lists" and _ACTION_VERB_RE.search(element_text):
+                # For list items, we assume they might be installation steps if they contain action verbs
+                action_items.append(element)
         
         # Identify installation steps (usually numbered or in a specific format)
-        installation_steps = self._identify_installation_steps(paragraphs, lists)
+        installation_steps = self._identify_installation_steps(step_paragraphs, action_items, numbered_paragraphs)
         
         # Identify components and tools sections
-        components_sections = self._identify_component_sections(paragraphs, headings)
-        tools_sections = self._identify_tool_sections(paragraphs, headings)
+        components_sections = self._identify_component_sections(paragraphs_by_page, headings)
+        tools_sections = self._identify_tool_sections(paragraphs_by_page, headings)
         
         # Organize into a structured document
         organized_doc = {
@@ -226,61 +512,37 @@ class PDFDocumentProcessor(DocumentProcessor):
         
         return organized_doc
     
-    def _identify_installation_steps(self, paragraphs: List[Dict[str, Any]], lists: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Identify installation steps from paragraphs and lists."""
-        import re
-        installation_steps = []
-        
-        # Check for numbered paragraphs (Step 1, Step 2, etc.)
-        for paragraph in paragraphs:
-            text = paragraph.get("text", "")
-            if text.strip().lower().startswith("step "):
-                installation_steps.append({
-                    "type": "installation_step",
-                    "text": text,
-                    "original_element": paragraph
-                })
-        
-        # Check list items as they often contain installation steps
-        for list_item in lists:
-            text = list_item.get("text", "")
-            # For list items, we assume they might be installation steps if they contain action verbs
-            action_verbs = ["install", "place", "position", "secure", "attach", "connect", "align", "adjust"]
-            if any(verb in text.lower() for verb in action_verbs):
-                installation_steps.append({
-                    "type": "installation_step",
-                    "text": text,
-                    "original_element": list_item
-                })
-        
-        # Also check for numbered items (1., 2., etc.) that might be installation steps
-        for paragraph in paragraphs:
-            text = paragraph.get("text", "")
-            # Look for paragraphs that start with a number followed by period
-            if re.match(r'^\d+\.', text.strip()):
-                installation_steps.append({
-                    "type": "installation_step",
-                    "text": text,
-                    "original_element": paragraph
-                })
+    def _identify_installation_steps(self, *candidate_groups: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Build installation steps from groups of candidate elements, ordered by page."""
+        installation_steps = [
+            {
+                "type": "installation_step",
+                "text": element.get("text", ""),
+                "original_element": element
+            }
+            for group in candidate_groups
+            for element in group
+        ]
         
         # Sort steps based on their position in the document
         installation_steps.sort(key=lambda x: x["original_element"].get("metadata", {}).get("page_number", 0))
         
         return installation_steps
     
-    def _identify_component_sections(self, paragraphs: List[Dict[str, Any]], headings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _identify_component_sections(
+        self,
+        paragraphs_by_page: Dict[Any, List[Dict[str, Any]]],
+        headings: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
         """Identify sections related to door components."""
         component_sections = []
         
         # Check headings for component-related titles
-        component_keywords = ["component", "part", "hardware", "material", "item"]
         for heading in headings:
-            text = heading.get("text", "").lower()
-            if any(keyword in text for keyword in component_keywords):
+            if _COMPONENT_HEADING_RE.search(heading.get("text", "")):
                 # Find paragraphs that might be under this heading
                 heading_page = heading.get("metadata", {}).get("page_number", 0)
-                related_paragraphs = [p for p in paragraphs if p.get("metadata", {}).get("page_number", 0) == heading_page]
+                related_paragraphs = list(paragraphs_by_page.get(heading_page, ()))
                 
                 component_sections.append({
                     "type": "component_section",
@@ -291,18 +553,20 @@ class PDFDocumentProcessor(DocumentProcessor):
         
         return component_sections
     
-    def _identify_tool_sections(self, paragraphs: List[Dict[str, Any]], headings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _identify_tool_sections(
+        self,
+        paragraphs_by_page: Dict[Any, List[Dict[str, Any]]],
+        headings: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
         """Identify sections related to tools required for installation."""
         tool_sections = []
         
         # Check headings for tool-related titles
-        tool_keywords = ["tool", "equipment", "required", "need"]
         for heading in headings:
-            text = heading.get("text", "").lower()
-            if any(keyword in text for keyword in tool_keywords):
+            if _TOOL_HEADING_RE.search(heading.get("text", "")):
                 # Find paragraphs that might be under this heading
                 heading_page = heading.get("metadata", {}).get("page_number", 0)
-                related_paragraphs = [p for p in paragraphs if p.get("metadata", {}).get("page_number", 0) == heading_page]
+                related_paragraphs = list(paragraphs_by_page.get(heading_page, ()))
                 
                 tool_sections.append({
                     "type": "tool_section",
@@ -313,39 +577,42 @@ class PDFDocumentProcessor(DocumentProcessor):
         
         return tool_sections
     
-    def _enrich_chunks_with_context(self, chunks: List[Dict[str, Any]], metadata: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _enrich_chunks_with_context(self, chunks: List[Chunk], metadata: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Enrich chunks with procedural context and metadata."""
-        import re
         enriched_chunks = []
         
+        # Document metadata shared by every chunk; each chunk gets a copy with
+        # its own chunk_id, which is cheaper than rebuilding the dict per chunk
+        base_metadata = {
+            **metadata,
+            "chunk_id": None,
+            "total_chunks": len(chunks)
+        }
+        
         for i, chunk in enumerate(chunks):
+            # Chunk types come from a small fixed set, so their traits are cached
+            is_step_type, type_content = _chunk_type_traits(chunk.type)
+            
             # Add document metadata to chunk
+            chunk_metadata = base_metadata.copy()
+            chunk_metadata["chunk_id"] = i
             enriched_chunk = {
-                **chunk,
-                "metadata": {
-                    **metadata,
-                    "chunk_id": i,
-                    "total_chunks": len(chunks)
-                }
+                "type": chunk.type,
+                "text": chunk.text,
+                "metadata": chunk_metadata
             }
             
             # Identify if the chunk contains installation steps
-            if "installation_step" in chunk.get("type", "").lower() or "step " in chunk.get("text", "").lower():
-                enriched_chunk["metadata"]["content_type"] = "installation_step"
+            if is_step_type or _STEP_MENTION_RE.search(chunk.text):
+                chunk_metadata["content_type"] = "installation_step"
                 
                 # Try to extract step number
-                text = chunk.get("text", "")
+                text = chunk.text
                 step_number = None
                 
                 # Try multiple patterns for step numbers
-                step_patterns = [
-                    r"Step\s+(\d+)",  # Step 1
-                    r"^(\d+)\.\s+",   # 1. 
-                    r"Step\s+(\d+):"   # Step 1:
-                ]
-                
-                for pattern in step_patterns:
-                    match = re.search(pattern, text, re.IGNORECASE)
+                for pattern in _STEP_NUMBER_PATTERNS:
+                    match = pattern.search(text)
                     if match:
                         try:
                             step_number = int(match.group(1))
@@ -354,13 +621,11 @@ class PDFDocumentProcessor(DocumentProcessor):
                             pass
                 
                 if step_number:
-                    enriched_chunk["metadata"]["step_number"] = step_number
+                    chunk_metadata["step_number"] = step_number
             
             # Identify tool and component chunks
-            if "tool" in chunk.get("type", "").lower():
-                enriched_chunk["metadata"]["content_type"] = "tools"
-            elif "component" in chunk.get("type", "").lower():
-                enriched_chunk["metadata"]["content_type"] = "components"
+            if type_content:
+                chunk_metadata["content_type"] = type_content
             
             enriched_chunks.append(enriched_chunk)
         
@@ -369,25 +634,28 @@ class PDFDocumentProcessor(DocumentProcessor):
 class HTMLDocumentProcessor(DocumentProcessor):
     """Processor for HTML documents."""
     
-    def process_document(self, file_path: str) -> List[Dict[str, Any]]:
+    def process_document(self, file_path: str, embed: bool = True) -> List[Dict[str, Any]]:
         """Process an HTML document and return chunks with metadata."""
-        logger.info(f"Processing HTML document: {file_path}")
+        logger.info("Processing HTML document: %s", file_path)
         
         if not UNSTRUCTURED_AVAILABLE:
             raise ImportError(
                 "The unstructured library is required for HTML processing. "
                 "Install it using 'pip install unstructured beautifulsoup4'"
             )
+        from unstructured.partition.html import partition_html
         
         try:
             # Extract elements from HTML using Unstructured
             elements = partition_html(file_path)
             
-            # Convert elements to dictionary for easier processing
-            elements_dict = [convert_to_dict(element) for element in elements]
+            # Convert elements to dictionary for easier processing, then drop the
+            # partitioned elements so they are freed before chunking
+            elements_dict = [_element_record(element) for element in elements]
+            del elements
             
             # Extract text and combine it for metadata extraction
-            combined_text = " ".join([e.get("text", "") for e in elements_dict if "text" in e])
+            combined_text = " ".join([e["text"] for e in elements_dict])
             
             # Extract metadata
             metadata = self.extract_metadata(file_path, combined_text)
@@ -399,14 +667,14 @@ class HTMLDocumentProcessor(DocumentProcessor):
             enriched_chunks = self._enrich_chunks_with_context(chunks, metadata)
             
             # Generate embeddings
-            for chunk in enriched_chunks:
-                chunk["embedding"] = self.embedding_generator.generate_embedding(chunk["text"])
+            if embed:
+                self._embed_chunks(enriched_chunks)
             
-            logger.info(f"Successfully processed document {file_path} into {len(enriched_chunks)} chunks")
+            logger.info("Successfully processed document %s into %s chunks", file_path, len(enriched_chunks))
             return enriched_chunks
             
         except Exception as e:
-            logger.error(f"Error processing HTML document {file_path}: {str(e)}")
+            logger.error("Error processing HTML document %s: %s", file_path, e)
             raise
     
     # Reuse methods from PDFDocumentProcessor with potential HTML-specific adaptations
@@ -416,88 +684,167 @@ class HTMLDocumentProcessor(DocumentProcessor):
     _identify_tool_sections = PDFDocumentProcessor._identify_tool_sections
     _enrich_chunks_with_context = PDFDocumentProcessor._enrich_chunks_with_context
 
-# Factory function to get the appropriate document processor
-def get_document_processor(file_type: str) -> DocumentProcessor:
-    """Get the appropriate document processor for the given file type."""
-    if file_type.lower() == ".pdf":
+@functools.lru_cache(maxsize=8)
+def _shared_document_processor(file_type: str) -> DocumentProcessor:
+    """Get the shared processor for a lowercased file type."""
+    if file_type == ".pdf":
         return PDFDocumentProcessor()
-    elif file_type.lower() in [".html", ".htm"]:
+    elif file_type in [".html", ".htm"]:
         return HTMLDocumentProcessor()
     else:
         raise ValueError(f"Unsupported file type: {file_type}")
 
+# Factory function to get the appropriate document processor
+def get_document_processor(file_type: str) -> DocumentProcessor:
+    """
+    Get the appropriate document processor for the given file type.
+    
+    Processors hold no per-document state, so one is created per file type
+    and shared. They use the process-wide embedding generator, so its model
+    is loaded only once, and only when something is embedded.
+    """
+    return _shared_document_processor(file_type.lower())
+
 # Main processing function for documents
-def process_document(file_path: str) -> List[Dict[str, Any]]:
-    """Process a document and return chunks with metadata."""
-    file_type = Path(file_path).suffix.lower()
+def process_document(file_path: str, embed: bool = True) -> List[Dict[str, Any]]:
+    """Process a document and return chunks with metadata, embedded unless embed is False."""
+    file_type = _split_file_name(file_path)[1]
     processor = get_document_processor(file_type)
-    return processor.process_document(file_path)
+    return processor.process_document(file_path, embed)
+
+# Default worker processes for batch processing; each worker loads its own
+# copy of unstructured's partitioning models, so this stays small
+_DEFAULT_BATCH_WORKERS = 4
+
+def create_document_pool(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """
+    Create a worker pool for process_documents_batch.
+    
+    Pass the pool to several process_documents_batch calls so workers are
+    started, and import the partitioning stack, once per run rather than once
+    per batch. Workers are spawned rather than forked so they do not inherit
+    the parent's threads. Workers start on first use.
+    
+    Args:
+        max_workers: Number of worker processes (defaults to 4, or fewer CPUs)
+        
+    Returns:
+        Process pool; shut it down, or use it as a context manager, when done
+    """
+    max_workers = max_workers or min(_DEFAULT_BATCH_WORKERS, os.cpu_count() or 1)
+    return ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+    )
 
 # Batch processing function
-def process_documents_batch(file_paths: List[str], max_workers: int = 4) -> Dict[str, List[Dict[str, Any]]]:
+def process_documents_batch(
+    file_paths: List[str],
+    max_workers: Optional[int] = None,
+    executor: Optional[ProcessPoolExecutor] = None,
+    on_result: Optional[Callable[[str, Optional[Exception]], None]] = None
+) -> Dict[str, List[Dict[str, Any]]]:
     """
     Process multiple documents in parallel.
     
+    PDF partitioning holds the GIL for most of its run time, so documents
+    are processed in separate worker processes. Workers skip embedding; the
+    chunks of all documents are embedded together afterwards in one batched
+    call.
+    
     Args:
         file_paths: List of file paths to process
-        max_workers: Maximum number of worker threads
+        max_workers: Maximum number of worker processes when no executor is given
+        executor: Pool from create_document_pool to reuse across calls
+        on_result: Called with each path as it finishes parsing, and the
+            exception if parsing failed (None otherwise)
         
     Returns:
-        Dictionary mapping file paths to their processed chunks
+        Dictionary mapping file paths to their processed chunks; documents
+        that failed to parse map to an empty list
     """
+    if not file_paths:
+        return {}
+    
     results = {}
     
-    # Use ThreadPoolExecutor for parallel processing
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+    # Use a pool for this call only unless the caller supplies one; spawning
+    # a worker is costly, so start no more than there are documents
+    owns_executor = executor is None
+    if owns_executor:
+        executor = create_document_pool(
+            min(max_workers or _DEFAULT_BATCH_WORKERS, os.cpu_count() or 1, len(file_paths))
+        )
+    
+    try:
         # Submit all processing tasks
         future_to_path = {
-            executor.submit(process_document, path): path 
+            executor.submit(process_document, path, False): path 
             for path in file_paths
         }
         
         # Collect results as they complete
-        for future in future_to_path:
+        for future in as_completed(future_to_path):
             path = future_to_path[future]
+            error = None
             try:
                 results[path] = future.result()
             except Exception as e:
-                logger.error(f"Error processing {path}: {str(e)}")
+                logger.error("Error processing %s: %s", path, e)
                 results[path] = []
+                error = e
+            if on_result is not None:
+                on_result(path, error)
+    finally:
+        if owns_executor:
+            executor.shutdown()
     
-    return results
+    # Embed every document's chunks in one batch
+    all_chunks = [chunk for chunks in results.values() for chunk in chunks]
+    if all_chunks:
+        _assign_embeddings(_shared_embedding_generator(), all_chunks)
+    
+    # Report results in input order
+    return {path: results[path] for path in file_paths}
 
 # Async batch processing
-async def process_documents_batch_async(file_paths: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+async def process_documents_batch_async(
+    file_paths: List[str],
+    max_concurrency: int = 8
+) -> Dict[str, List[Dict[str, Any]]]:
     """
     Process multiple documents asynchronously.
     
     Args:
         file_paths: List of file paths to process
+        max_concurrency: Maximum number of documents processed at once
         
     Returns:
         Dictionary mapping file paths to their processed chunks
     """
     results = {}
-    tasks = []
+    semaphore = asyncio.Semaphore(max_concurrency)
     
     # Create a document processor for each file type
     processors = {}
     
+    async def process_one(path: str, processor: DocumentProcessor) -> List[Dict[str, Any]]:
+        async with semaphore:
+            return await processor.process_document_async(path)
+    
+    coroutines = []
     for path in file_paths:
-        file_type = Path(path).suffix.lower()
+        file_type = _split_file_name(path)[1]
         if file_type not in processors:
             processors[file_type] = get_document_processor(file_type)
-        
-        # Create async task
-        task = asyncio.create_task(processors[file_type].process_document_async(path))
-        tasks.append((path, task))
+        coroutines.append(process_one(path, processors[file_type]))
     
-    # Await all tasks
-    for path, task in tasks:
-        try:
-            results[path] = await task
-        except Exception as e:
-            logger.error(f"Error processing {path}: {str(e)}")
+    # Await all documents together; a failure in one does not stop the others
+    outcomes = await asyncio.gather(*coroutines, return_exceptions=True)
+    for path, outcome in zip(file_paths, outcomes):
+        if isinstance(outcome, BaseException):
+            logger.error("Error processing %s: %s", path, outcome)
             results[path] = []
+        else:
+            results[path] = outcome
     
-    return results
\ No newline at end of file
+    return results
@@ -4,12 +4,18 @@ Handles creation of vector embeddings for text chunks.
 """
 
 import logging
-from typing import List, Dict, Any, Union, Optional
+from typing import List, Dict, Any, Union, Optional, Tuple
 import numpy as np
 import time
+import random
 import os
+import hashlib
+import sqlite3
+import threading
 import importlib
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 # Import openai conditionally to handle import errors
 try:
@@ -19,10 +25,46 @@ except ImportError:
     OPENAI_AVAILABLE = False
     logging.warning("OpenAI library not available. Using mock embeddings by default.")
 
+def _openai_retryable_errors() -> Tuple[type, ...]:
+    """Get the openai exception types worth retrying, from the legacy or current client."""
+    if not OPENAI_AVAILABLE:
+        return ()
+    names = (
+        "RateLimitError", "Timeout", "APITimeoutError", "APIConnectionError",
+        "ServiceUnavailableError", "InternalServerError", "TryAgain",
+    )
+    errors = set()
+    for module in (getattr(openai, "error", None), openai):
+        for name in names:
+            error = getattr(module, name, None)
+            if isinstance(error, type) and issubclass(error, Exception):
+                errors.add(error)
+    return tuple(errors)
+
+_OPENAI_RETRYABLE_ERRORS = _openai_retryable_errors()
+
 from config.app_config import get_config
 
 logger = logging.getLogger(__name__)
 
+def _mock_embeddings(texts: List[str], dimension: int) -> np.ndarray:
+    """
+    Deterministic pseudo-random vectors in [0, 1), one row per text.
+    
+    Each element is a SplitMix64 hash of the text's hash and the element
+    index, so a whole batch is generated with a few array operations and the
+    same text always maps to the same vector within a process.
+    """
+    with np.errstate(over="ignore"):
+        seeds = np.array([hash(text) & 0xFFFFFFFFFFFFFFFF for text in texts], dtype=np.uint64)
+        state = seeds[:, np.newaxis] * np.uint64(dimension) + np.arange(dimension, dtype=np.uint64)
+        state += np.uint64(0x9E3779B97F4A7C15)
+        state = (state ^ (state >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        state = (state ^ (state >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        state ^= state >> np.uint64(31)
+    # Top 53 bits give a uniformly spaced double in [0, 1)
+    return (state >> np.uint64(11)) * (1.0 / (1 << 53))
+
 class BaseEmbeddingGenerator(ABC):
     """Base class for embedding generators."""
     
@@ -35,6 +77,18 @@ class BaseEmbeddingGenerator(ABC):
     def generate_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
         """Generate embeddings for a batch of text chunks."""
         pass
+    
+    def generate_embeddings_batch_with_fallbacks(
+        self,
+        texts: List[str]
+    ) -> Tuple[List[List[float]], List[bool]]:
+        """
+        Generate embeddings for a batch, flagging rows that are stand-in vectors.
+        
+        Stand-ins are mock vectors substituted when no real embedding was
+        produced; callers such as the embedding cache should not keep them.
+        """
+        return self.generate_embeddings_batch(texts), [False] * len(texts)
 
 class EmbeddingGenerator(BaseEmbeddingGenerator):
     """Generates embeddings for text chunks."""
@@ -58,7 +112,7 @@ class EmbeddingGenerator(BaseEmbeddingGenerator):
         elif provider_name == "mock":
             self.provider = "mock"
         else:
-            logger.warning(f"Unsupported embedding provider: {provider_name}. Using mock embeddings.")
+            logger.warning("Unsupported embedding provider: %s. Using mock embeddings.", provider_name)
             self.provider = "mock"
     
     def _setup_openai(self):
@@ -102,29 +156,51 @@ class EmbeddingGenerator(BaseEmbeddingGenerator):
     
     def generate_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
         """Generate embeddings for a batch of text chunks."""
+        return self.generate_embeddings_batch_with_fallbacks(texts)[0]
+    
+    def generate_embeddings_batch_with_fallbacks(
+        self,
+        texts: List[str]
+    ) -> Tuple[List[List[float]], List[bool]]:
+        """
+        Generate embeddings for a batch, flagging rows that are stand-in vectors.
+        
+        Texts the provider fails to embed, and all texts when no provider is
+        available, get mock vectors flagged True. Empty texts get zero vectors.
+        """
         if not texts:
-            return []
+            return [], []
             
         # Filter out empty texts
         filtered_texts = [text.strip() for text in texts]
         filtered_indices = [i for i, text in enumerate(filtered_texts) if text]
         
+        # Reconstruct the full list with zero vectors for empty texts
+        result = [[0.0] * self.dimension] * len(texts)
+        fallbacks = [False] * len(texts)
         if not filtered_indices:
-            return [[0.0] * self.dimension] * len(texts)
-            
+            return result, fallbacks
+        
+        batch_texts = [texts[i] for i in filtered_indices]
         if self.provider == "openai":
-            embeddings = self._generate_openai_embeddings_batch([texts[i] for i in filtered_indices])
+            embeddings = self._generate_openai_embeddings_batch(batch_texts)
         elif self.provider == "huggingface":
-            embeddings = self._generate_huggingface_embeddings_batch([texts[i] for i in filtered_indices])
+            embeddings = self._generate_huggingface_embeddings_batch(batch_texts)
         else:
-            embeddings = [self._generate_mock_embedding(texts[i]) for i in filtered_indices]
+            embeddings = [None] * len(batch_texts)
+        
+        # Substitute mock embeddings for the rows the provider could not embed
+        failed = [row for row, embedding in enumerate(embeddings) if embedding is None]
+        if failed:
+            mock_embeddings = self._generate_mock_embeddings_batch([batch_texts[row] for row in failed])
+            for row, embedding in zip(failed, mock_embeddings):
+                embeddings[row] = embedding
+                fallbacks[filtered_indices[row]] = True
         
-        # Reconstruct the full list with zero vectors for empty texts
-        result = [[0.0] * self.dimension] * len(texts)
         for idx, embedding in zip(filtered_indices, embeddings):
             result[idx] = embedding
             
-        return result
+        return result, fallbacks
     
     def _generate_openai_embedding(self, text: str) -> List[float]:
         """Generate an embedding using OpenAI."""
@@ -132,121 +208,109 @@ class EmbeddingGenerator(BaseEmbeddingGenerator):
             return self._generate_mock_embedding(text)
             
         try:
-            # Retry mechanism for API rate limits
-            max_retries = 3
-            retry_delay = 1
+            response = self._create_openai_embeddings(text)
             
-            for attempt in range(max_retries):
-                try:
-                    response = openai.Embedding.create(
-                        model=getattr(self.config, "model_name", "text-embedding-3-small"),
-                        input=text
-                    )
-                    
-                    # Extract and return the embedding
-                    if "data" in response and len(response["data"]) > 0:
-                        return response["data"][0]["embedding"]
-                    else:
-                        logger.error(f"Unexpected OpenAI API response format: {response}")
-                        return self._generate_mock_embedding(text)
-                        
-                except Exception as rate_error:
-                    # Check if it's a rate limit error
-                    is_rate_error = (
-                        hasattr(openai, "error") and 
-                        isinstance(rate_error, openai.error.RateLimitError)
-                    )
-                    
-                    if is_rate_error and attempt < max_retries - 1:
-                        logger.warning(f"Rate limit hit, retrying in {retry_delay} seconds...")
-                        time.sleep(retry_delay)
-                        retry_delay *= 2
-                    else:
-                        raise
+            # Extract and return the embedding
+            if "data" in response and len(response["data"]) > 0:
+                return response["data"][0]["embedding"]
+            else:
+                logger.error("Unexpected OpenAI API response format: %s", response)
+                return self._generate_mock_embedding(text)
         
         except Exception as e:
-            logger.error(f"Error generating OpenAI embedding: {str(e)}")
+            logger.error("Error generating OpenAI embedding: %s", e)
             # Fall back to mock embedding in case of error
             return self._generate_mock_embedding(text)
     
-    def _generate_openai_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
-        """Generate embeddings for a batch of texts using OpenAI."""
+    def _create_openai_embeddings(self, embedding_input: Union[str, List[str]]) -> Any:
+        """
+        Call the OpenAI embeddings API, retrying rate limits and transient errors.
+        
+        Retries back off exponentially with full jitter, so concurrent batch
+        requests that were throttled together do not retry in lockstep. The
+        last error is raised once max_retries attempts have failed.
+        """
+        max_retries = max(1, getattr(self.config, "max_retries", 6))
+        max_delay = getattr(self.config, "retry_max_delay", 30.0)
+        
+        for attempt in range(max_retries):
+            try:
+                return openai.Embedding.create(
+                    model=getattr(self.config, "model_name", "text-embedding-3-small"),
+                    input=embedding_input
+                )
+            except _OPENAI_RETRYABLE_ERRORS as e:
+                if attempt == max_retries - 1:
+                    raise
+                retry_delay = random.uniform(0, min(max_delay, 2 ** attempt))
+                logger.warning(
+                    "OpenAI request failed (%s), retrying in %.1f seconds (attempt %s of %s)...",
+                    type(e).__name__, retry_delay, attempt + 1, max_retries
+                )
+                time.sleep(retry_delay)
+    
+    def _generate_openai_embeddings_batch(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """Generate embeddings for a batch of texts using OpenAI; rows that failed are None."""
         if not OPENAI_AVAILABLE:
-            return [self._generate_mock_embedding(text) for text in texts]
+            return [None] * len(texts)
             
-        embeddings = []
         batch_size = getattr(self.config, "batch_size", 100)
         
         # Process in batches to avoid API limits
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i:i+batch_size]
-            
-            try:
-                # Retry mechanism for API rate limits
-                max_retries = 3
-                retry_delay = 1
-                
-                for attempt in range(max_retries):
-                    try:
-                        response = openai.Embedding.create(
-                            model=getattr(self.config, "model_name", "text-embedding-3-small"),
-                            input=batch
-                        )
-                        
-                        if "data" in response and len(response["data"]) == len(batch):
-                            batch_embeddings = [item["embedding"] for item in response["data"]]
-                            embeddings.extend(batch_embeddings)
-                            break
-                        else:
-                            logger.error(f"Unexpected OpenAI API response format: {response}")
-                            # Fall back to mock embeddings for this batch
-                            embeddings.extend([self._generate_mock_embedding(text) for text in batch])
-                            break
-                            
-                    except Exception as rate_error:
-                        is_rate_error = (
-                            hasattr(openai, "error") and 
-                            isinstance(rate_error, openai.error.RateLimitError)
-                        )
-                        
-                        if is_rate_error and attempt < max_retries - 1:
-                            logger.warning(f"Rate limit hit, retrying in {retry_delay} seconds...")
-                            time.sleep(retry_delay)
-                            retry_delay *= 2
-                        else:
-                            raise
-            
-            except Exception as e:
-                logger.error(f"Error generating OpenAI embeddings batch: {str(e)}")
-                # Fall back to mock embeddings for this batch
-                embeddings.extend([self._generate_mock_embedding(text) for text in batch])
+        batches = [texts[i:i+batch_size] for i in range(0, len(texts), batch_size)]
+        if len(batches) == 1:
+            batch_results = [self._generate_openai_embeddings_request(batches[0])]
+        else:
+            # Requests are latency-bound, so keep several in flight at once
+            max_workers = min(getattr(self.config, "max_concurrent_requests", 8), len(batches))
+            with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="openai-embed") as executor:
+                batch_results = list(executor.map(self._generate_openai_embeddings_request, batches))
         
+        embeddings = []
+        for batch, batch_embeddings in zip(batches, batch_results):
+            embeddings.extend(batch_embeddings if batch_embeddings is not None else [None] * len(batch))
         return embeddings
     
+    def _generate_openai_embeddings_request(self, batch: List[str]) -> Optional[List[List[float]]]:
+        """Embed one API-sized batch with OpenAI, retrying transient errors; None if it failed."""
+        try:
+            response = self._create_openai_embeddings(batch)
+            
+            if "data" in response and len(response["data"]) == len(batch):
+                return [item["embedding"] for item in response["data"]]
+            else:
+                logger.error("Unexpected OpenAI API response format: %s", response)
+                return None
+        
+        except Exception as e:
+            logger.error("Error generating OpenAI embeddings batch: %s", e)
+            return None
+    
     def _generate_huggingface_embedding(self, text: str) -> List[float]:
         """Generate an embedding using HuggingFace."""
         try:
             embedding = self.model.encode(text)
             return embedding.tolist()
         except Exception as e:
-            logger.error(f"Error generating HuggingFace embedding: {str(e)}")
+            logger.error("Error generating HuggingFace embedding: %s", e)
             return self._generate_mock_embedding(text)
     
-    def _generate_huggingface_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
-        """Generate embeddings for a batch of texts using HuggingFace."""
+    def _generate_huggingface_embeddings_batch(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """Generate embeddings for a batch of texts using HuggingFace; rows that failed are None."""
         try:
-            embeddings = self.model.encode(texts)
+            embeddings = self.model.encode(texts, batch_size=getattr(self.config, "batch_size", 32))
             return embeddings.tolist()
         except Exception as e:
-            logger.error(f"Error generating HuggingFace embeddings batch: {str(e)}")
-            return [self._generate_mock_embedding(text) for text in texts]
+            logger.error("Error generating HuggingFace embeddings batch: %s", e)
+            return [None] * len(texts)
     
     def _generate_mock_embedding(self, text: str) -> List[float]:
         """Generate a mock embedding (deterministic pseudo-random vector)."""
-        # Generate a deterministic but seemingly random vector based on the text hash
-        text_hash = hash(text) % 10000
-        np.random.seed(text_hash)
-        return np.random.rand(self.dimension).tolist()
+        return _mock_embeddings([text], self.dimension)[0].tolist()
+    
+    def _generate_mock_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+        """Generate mock embeddings for a batch of texts."""
+        return _mock_embeddings(texts, self.dimension).tolist()
 
 class MockEmbeddingGenerator(BaseEmbeddingGenerator):
     """Mock embedding generator for testing and development."""
@@ -259,18 +323,141 @@ class MockEmbeddingGenerator(BaseEmbeddingGenerator):
         if not text.strip():
             return [0.0] * self.dimension
         
-        # Generate a deterministic but seemingly random vector based on the text hash
-        text_hash = hash(text) % 10000
-        np.random.seed(text_hash)
-        return np.random.rand(self.dimension).tolist()
+        return _mock_embeddings([text], self.dimension)[0].tolist()
     
     def generate_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
         """Generate mock embeddings for a batch of texts."""
-        return [self.generate_embedding(text) for text in texts]
+        if not texts:
+            return []
+        
+        embeddings = _mock_embeddings(texts, self.dimension)
+        # Empty texts get zero vectors, as in generate_embedding
+        empty_rows = [i for i, text in enumerate(texts) if not text.strip()]
+        if empty_rows:
+            embeddings[empty_rows] = 0.0
+        return embeddings.tolist()
+    
+    def generate_embeddings_batch_with_fallbacks(
+        self,
+        texts: List[str]
+    ) -> Tuple[List[List[float]], List[bool]]:
+        """Generate mock embeddings for a batch; every non-empty row is a stand-in."""
+        return self.generate_embeddings_batch(texts), [bool(text.strip()) for text in texts]
+
+class CachedEmbeddingGenerator(BaseEmbeddingGenerator):
+    """
+    Embedding generator that caches vectors on disk by text content.
+    
+    Vectors are stored in SQLite as float32 blobs keyed by the wrapped
+    generator's model and the SHA-256 of the whitespace-normalized text, so
+    unchanged and duplicated chunks are embedded once across runs. Stand-in
+    vectors the wrapped generator substitutes after provider errors are
+    returned but not cached, so those texts are embedded again next time.
+    """
+    
+    # Stay under SQLite's default limit on bound parameters per statement
+    _LOOKUP_BATCH = 500
+    
+    def __init__(self, generator: BaseEmbeddingGenerator, cache_path: str):
+        self.generator = generator
+        self.dimension = getattr(generator, "dimension", 1536)
+        generator_config = getattr(generator, "config", None)
+        self.model_key = "{}:{}:{}".format(
+            getattr(generator, "provider", None) or type(generator).__name__,
+            getattr(generator_config, "model_name", ""),
+            self.dimension
+        )
+        
+        Path(cache_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(cache_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embedding_cache ("
+                "model TEXT NOT NULL, text_hash BLOB NOT NULL, vector BLOB NOT NULL, "
+                "PRIMARY KEY (model, text_hash))"
+            )
+            self._conn.commit()
+    
+    @staticmethod
+    def _text_hash(text: str) -> bytes:
+        """Hash text with runs of whitespace collapsed and the ends trimmed."""
+        return hashlib.sha256(" ".join(text.split()).encode("utf-8")).digest()
+    
+    def _lookup(self, hashes: List[bytes]) -> Dict[bytes, List[float]]:
+        """Get cached vectors for the given text hashes."""
+        found = {}
+        with self._lock:
+            for i in range(0, len(hashes), self._LOOKUP_BATCH):
+                batch = hashes[i:i + self._LOOKUP_BATCH]
+                rows = self._conn.execute(
+                    "SELECT text_hash, vector FROM embedding_cache WHERE model = ? AND text_hash IN ({})".format(
+                        ",".join("?" * len(batch))
+                    ),
+                    (self.model_key, *batch)
+                )
+                for text_hash, vector in rows:
+                    found[text_hash] = np.frombuffer(vector, dtype=np.float32).tolist()
+        return found
+    
+    def _store(self, embeddings: Dict[bytes, List[float]]) -> None:
+        """Write new vectors to the cache."""
+        rows = [
+            (self.model_key, text_hash, np.asarray(embedding, dtype=np.float32).tobytes())
+            for text_hash, embedding in embeddings.items()
+        ]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embedding_cache (model, text_hash, vector) VALUES (?, ?, ?)",
+                rows
+            )
+            self._conn.commit()
+    
+    def generate_embedding(self, text: str) -> List[float]:
+        """Generate an embedding for a single text chunk, using the cache if possible."""
+        return self.generate_embeddings_batch([text])[0]
+    
+    def generate_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+        """Generate embeddings for a batch of texts, embedding only cache misses."""
+        if not texts:
+            return []
+        
+        hashes = [self._text_hash(text) for text in texts]
+        embeddings = self._lookup(list(set(hashes)))
+        
+        # Embed each missing text once, even if it repeats within the batch
+        missing = {}
+        for text_hash, text in zip(hashes, texts):
+            if text_hash not in embeddings and text_hash not in missing:
+                missing[text_hash] = text
+        
+        if missing:
+            logger.debug("Embedding cache: %s hits, %s misses", len(texts) - len(missing), len(missing))
+            fresh, fallbacks = self.generator.generate_embeddings_batch_with_fallbacks(list(missing.values()))
+            embeddings.update(zip(missing, fresh))
+            
+            # Store only real embeddings; stand-ins would outlive the outage that caused them
+            real = {
+                text_hash: embedding
+                for text_hash, embedding, is_fallback in zip(missing, fresh, fallbacks)
+                if not is_fallback
+            }
+            if real:
+                self._store(real)
+        
+        return [embeddings[text_hash] for text_hash in hashes]
+    
+    def close(self) -> None:
+        """Close the cache database."""
+        with self._lock:
+            self._conn.close()
 
 class SimilarityCalculator:
     """Utility class for calculating similarity between embeddings."""
     
+    # Rows upcast per block when scoring int8 matrices, bounding the temporary
+    _QUANTIZED_BLOCK_ROWS = 4096
+    
     @staticmethod
     def cosine_similarity(vec1: List[float], vec2: List[float]) -> float:
         """
@@ -330,31 +517,103 @@ class SimilarityCalculator:
         return np.dot(vec1, vec2)
     
     @staticmethod
-    def batch_cosine_similarity(query_vec: List[float], doc_vecs: List[List[float]]) -> List[float]:
+    def normalize_matrix(vectors: Union[np.ndarray, List[List[float]]]) -> np.ndarray:
+        """
+        L2-normalize vectors into a float32, C-contiguous matrix.
+        
+        Normalize stored document vectors once and pass the result to
+        batch_cosine_similarity with normalized=True to skip per-query work.
+        
+        Args:
+            vectors: Matrix or list of vectors, one per row
+            
+        Returns:
+            Matrix of unit-length rows (all-zero rows stay zero)
+        """
+        matrix = np.array(vectors, dtype=np.float32, order="C")
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0  # Avoid division by zero
+        matrix /= norms
+        return matrix
+    
+    @staticmethod
+    def batch_cosine_similarity(
+        query_vec: Union[np.ndarray, List[float]],
+        doc_vecs: Union[np.ndarray, List[List[float]]],
+        normalized: bool = False
+    ) -> List[float]:
         """
         Calculate cosine similarity between a query vector and multiple document vectors.
         
         Args:
             query_vec: Query vector
-            doc_vecs: List of document vectors
+            doc_vecs: Document vectors, or the output of normalize_matrix
+            normalized: Whether doc_vecs are already L2-normalized
             
         Returns:
             List of similarity scores
         """
-        query_vec = np.array(query_vec)
-        doc_vecs = np.array(doc_vecs)
+        if normalized:
+            normalized_docs = np.asarray(doc_vecs, dtype=np.float32)
+        else:
+            normalized_docs = SimilarityCalculator.normalize_matrix(doc_vecs)
         
         # Normalize query vector
+        query_vec = np.asarray(query_vec, dtype=np.float32)
         query_norm = np.linalg.norm(query_vec)
         if query_norm > 0:
             query_vec = query_vec / query_norm
         
-        # Normalize document vectors
-        doc_norms = np.linalg.norm(doc_vecs, axis=1, keepdims=True)
-        doc_norms[doc_norms == 0] = 1.0  # Avoid division by zero
-        normalized_docs = doc_vecs / doc_norms
+        # One matrix-vector product against the unit-length rows
+        return np.dot(normalized_docs, query_vec).tolist()
+    
+    @staticmethod
+    def quantize_matrix(vectors: Union[np.ndarray, List[List[float]]]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        L2-normalize vectors and quantize them to int8 for compact in-memory scoring.
+        
+        Each row gets a symmetric max-abs scale, so row ~= quantized_row * scale.
+        This takes a quarter of the memory of float32 rows.
+        
+        Args:
+            vectors: Matrix or list of vectors, one per row
+            
+        Returns:
+            Tuple of (int8 matrix, float32 per-row scales)
+        """
+        matrix = SimilarityCalculator.normalize_matrix(vectors)
+        scales = np.abs(matrix).max(axis=1) / 127.0
+        scales[scales == 0] = 1.0  # All-zero rows quantize to zero
+        quantized = np.rint(matrix / scales[:, np.newaxis]).astype(np.int8)
+        return quantized, scales.astype(np.float32)
+    
+    @staticmethod
+    def quantized_cosine_similarity(
+        query_vec: Union[np.ndarray, List[float]],
+        quantized_docs: np.ndarray,
+        scales: np.ndarray
+    ) -> List[float]:
+        """
+        Calculate approximate cosine similarity against quantize_matrix output.
+        
+        Args:
+            query_vec: Query vector
+            quantized_docs: int8 document matrix from quantize_matrix
+            scales: Per-row scales from quantize_matrix
+            
+        Returns:
+            List of similarity scores
+        """
+        query_vec = np.asarray(query_vec, dtype=np.float32)
+        query_norm = np.linalg.norm(query_vec)
+        if query_norm > 0:
+            query_vec = query_vec / query_norm
         
-        # Calculate similarities
-        similarities = np.dot(normalized_docs, query_vec)
+        similarities = np.empty(len(quantized_docs), dtype=np.float32)
+        block = SimilarityCalculator._QUANTIZED_BLOCK_ROWS
+        for start in range(0, len(quantized_docs), block):
+            rows = quantized_docs[start:start + block].astype(np.float32)
+            similarities[start:start + block] = np.dot(rows, query_vec)
+        similarities *= scales
         
-        return similarities.tolist()
\ No newline at end of file
+        return similarities.tolist()
@@ -68,7 +68,7 @@ class Evaluator:
             return result
         
         except Exception as e:
-            logger.error(f"Error evaluating response: {str(e)}")
+            logger.error("Error evaluating response: %s", e)
             return {
                 "metrics": {},
                 "domain_evaluation": {},
@@ -174,7 +174,7 @@ class Evaluator:
                         "reason": metric.reason
                     }
                 except Exception as e:
-                    logger.error(f"Error calculating metric {metric.name}: {str(e)}")
+                    logger.error("Error calculating metric %s: %s", metric.name, e)
                     metrics_results[metric.name] = {
                         "score": 0.0,
                         "passed": False,
@@ -193,7 +193,7 @@ class Evaluator:
             }
         
         except Exception as e:
-            logger.error(f"Error evaluating retrieval: {str(e)}")
+            logger.error("Error evaluating retrieval: %s", e)
             return {
                 "documents": [],
                 "avg_relevance": 0.0,
@@ -252,7 +252,7 @@ class Evaluator:
             }
         
         except Exception as e:
-            logger.error(f"Error evaluating end-to-end: {str(e)}")
+            logger.error("Error evaluating end-to-end: %s", e)
             return {
                 "query": query,
                 "response": "",
@@ -296,7 +296,7 @@ class Evaluator:
             }
         
         except Exception as e:
-            logger.error(f"Error in batch evaluation: {str(e)}")
+            logger.error("Error in batch evaluation: %s", e)
             return {
                 "results": [],
                 "avg_overall_score": 0.0,
@@ -403,7 +403,7 @@ class Evaluator:
             return evaluation_summary
         
         except Exception as e:
-            logger.error(f"Error evaluating with scenarios: {str(e)}")
+            logger.error("Error evaluating with scenarios: %s", e)
             return {
                 "results": [],
                 "avg_overall_score": 0.0,
@@ -447,7 +447,7 @@ class Evaluator:
             return results
         
         except Exception as e:
-            logger.error(f"Error evaluating with DeepEval: {str(e)}")
+            logger.error("Error evaluating with DeepEval: %s", e)
             return {
                 "evaluation_results": None,
                 "metrics": {},
@@ -524,9 +524,9 @@ class Evaluator:
                         result.get("scenario", {}).get("difficulty", "unknown")
                     ])
             
-            logger.info(f"Exported {len(individual_results)} results to {output_path}")
+            logger.info("Exported %s results to %s", len(individual_results), output_path)
             return True
         
         except Exception as e:
-            logger.error(f"Error exporting results to CSV: {str(e)}")
+            logger.error("Error exporting results to CSV: %s", e)
             return False
\ No newline at end of file
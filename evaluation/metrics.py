@@ -41,7 +41,7 @@ class MetricsCalculator:
             ]
             
         except Exception as e:
-            logger.error(f"Error setting up metrics: {str(e)}")
+            logger.error("Error setting up metrics: %s", e)
     
     def calculate_metrics(
         self, 
@@ -82,7 +82,7 @@ class MetricsCalculator:
                         "reason": metric.reason
                     }
                 except Exception as e:
-                    logger.error(f"Error calculating metric {metric.name}: {str(e)}")
+                    logger.error("Error calculating metric %s: %s", metric.name, e)
                     results[metric.name] = {
                         "score": 0.0,
                         "passed": False,
@@ -99,7 +99,7 @@ class MetricsCalculator:
             }
         
         except Exception as e:
-            logger.error(f"Error calculating metrics: {str(e)}")
+            logger.error("Error calculating metrics: %s", e)
             return {
                 "metrics": {},
                 "overall_score": 0.0,
@@ -41,7 +41,7 @@ class ScenarioGenerator:
                     "safety": self._get_safety_templates()
                 }
         except Exception as e:
-            logger.error(f"Error loading scenario templates: {str(e)}")
+            logger.error("Error loading scenario templates: %s", e)
             return {
                 "installation": self._get_installation_templates(),
                 "troubleshooting": self._get_troubleshooting_templates(),
@@ -273,7 +273,7 @@ class ScenarioGenerator:
             return scenarios
         
         except Exception as e:
-            logger.error(f"Error generating scenarios: {str(e)}")
+            logger.error("Error generating scenarios: %s", e)
             return []
     
     def save_scenarios(self, scenarios: List[Dict[str, Any]], output_path: str) -> bool:
@@ -291,11 +291,11 @@ class ScenarioGenerator:
             with open(output_path, 'w') as f:
                 json.dump(scenarios, f, indent=2)
             
-            logger.info(f"Saved {len(scenarios)} scenarios to {output_path}")
+            logger.info("Saved %s scenarios to %s", len(scenarios), output_path)
             return True
         
         except Exception as e:
-            logger.error(f"Error saving scenarios: {str(e)}")
+            logger.error("Error saving scenarios: %s", e)
             return False
     
     def load_scenarios(self, input_path: str) -> List[Dict[str, Any]]:
@@ -312,11 +312,11 @@ class ScenarioGenerator:
             with open(input_path, 'r') as f:
                 scenarios = json.load(f)
             
-            logger.info(f"Loaded {len(scenarios)} scenarios from {input_path}")
+            logger.info("Loaded %s scenarios from %s", len(scenarios), input_path)
             return scenarios
         
         except Exception as e:
-            logger.error(f"Error loading scenarios: {str(e)}")
+            logger.error("Error loading scenarios: %s", e)
             return []
     
     def generate_evaluation_dataset(
@@ -376,5 +376,5 @@ class ScenarioGenerator:
             return all_scenarios
         
         except Exception as e:
-            logger.error(f"Error generating evaluation dataset: {str(e)}")
+            logger.error("Error generating evaluation dataset: %s", e)
             return []
\ No newline at end of file
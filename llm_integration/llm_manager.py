@@ -98,14 +98,14 @@ class LLMManager:
                 
                 except openai.error.RateLimitError:
                     if attempt < max_retries - 1:
-                        logger.warning(f"Rate limit hit, retrying in {retry_delay} seconds...")
+                        logger.warning("Rate limit hit, retrying in %s seconds...", retry_delay)
                         time.sleep(retry_delay)
                         retry_delay *= 2
                     else:
                         raise
         
         except Exception as e:
-            logger.error(f"Error generating OpenAI response: {str(e)}")
+            logger.error("Error generating OpenAI response: %s", e)
             return f"I'm sorry, I encountered an error while generating a response. Please try again later."
     
     def analyze_query(self, query: str) -> Dict[str, Any]:
@@ -153,7 +153,7 @@ class LLMManager:
             
             except (json.JSONDecodeError, AttributeError):
                 # If JSON parsing fails, return a basic structure
-                logger.warning(f"Failed to parse analysis JSON: {response}")
+                logger.warning("Failed to parse analysis JSON: %s", response)
                 return {
                     "primary_intent": "unknown",
                     "door_category": None,
@@ -163,7 +163,7 @@ class LLMManager:
                 }
         
         except Exception as e:
-            logger.error(f"Error analyzing query: {str(e)}")
+            logger.error("Error analyzing query: %s", e)
             return {
                 "primary_intent": "unknown",
                 "door_category": None,
@@ -231,7 +231,7 @@ class LLMManager:
             return response
         
         except Exception as e:
-            logger.error(f"Error generating installation response: {str(e)}")
+            logger.error("Error generating installation response: %s", e)
             return (
                 "I'm sorry, I encountered an error while generating a response about door installation. "
                 "Please try asking a more specific question about the installation process."
@@ -50,7 +50,7 @@ class DoorInstallationAssistant:
             Dictionary with ingestion results.
         """
         try:
-            logger.info(f"Ingesting documents from {directory_path}")
+            logger.info("Ingesting documents from %s", directory_path)
             
             # Create data directory if it doesn't exist
             data_dir = Path(self.config.data_dir)
@@ -63,7 +63,7 @@ class DoorInstallationAssistant:
                     if file.lower().endswith('.pdf'):
                         pdf_files.append(os.path.join(root, file))
             
-            logger.info(f"Found {len(pdf_files)} PDF files")
+            logger.info("Found %s PDF files", len(pdf_files))
             
             # Process each document
             results = {
@@ -76,25 +76,28 @@ class DoorInstallationAssistant:
                 try:
                     # Process document
                     chunks = process_document(file_path)
-                    logger.info(f"Processed {file_path} into {len(chunks)} chunks")
+                    logger.info("Processed %s into %s chunks", file_path, len(chunks))
                     
                     # Add chunks to vector store
                     document_ids = self.vector_store.add_documents(chunks)
-                    logger.info(f"Added {len(document_ids)} chunks to vector store")
+                    logger.info("Added %s chunks to vector store", len(document_ids))
                     
                     # Update results
                     results["processed"] += 1
                     results["document_ids"].extend(document_ids)
                 
                 except Exception as e:
-                    logger.error(f"Error processing {file_path}: {str(e)}")
+                    logger.error("Error processing %s: %s", file_path, e)
                     results["failed"] += 1
             
-            logger.info(f"Ingestion complete: {results['processed']} documents processed, {results['failed']} failed")
+            logger.info(
+                "Ingestion complete: %s documents processed, %s failed",
+                results['processed'], results['failed']
+            )
             return results
         
         except Exception as e:
-            logger.error(f"Error ingesting documents: {str(e)}")
+            logger.error("Error ingesting documents: %s", e)
             return {
                 "processed": 0,
                 "failed": 0,
@@ -132,7 +135,7 @@ class DoorInstallationAssistant:
             return response
         
         except Exception as e:
-            logger.error(f"Error processing query: {str(e)}")
+            logger.error("Error processing query: %s", e)
             return {
                 "response": "I'm sorry, I encountered an error while processing your query. Please try again.",
                 "session_id": session_id,
@@ -198,7 +201,7 @@ class DoorInstallationAssistant:
             }
         
         except Exception as e:
-            logger.error(f"Error evaluating system: {str(e)}")
+            logger.error("Error evaluating system: %s", e)
             return {
                 "results": [],
                 "overall_metrics": {},
@@ -222,7 +225,7 @@ class DoorInstallationAssistant:
             return results
         
         except Exception as e:
-            logger.error(f"Error searching documents: {str(e)}")
+            logger.error("Error searching documents: %s", e)
             return []
 
 def main():
@@ -32,13 +32,24 @@ class Reranker:
                 else:
                     self.reranker = Client(api_key)
             else:
-                logger.info(f"Using simple reranking (no external reranker)")
+                logger.info("Using simple reranking (no external reranker)")
                 self.reranker_type = "simple"
         
         except ImportError:
-            logger.warning(f"Could not import {reranker_model} library. Using simple reranking.")
+            logger.warning("Could not import %s library. Using simple reranking.", reranker_model)
             self.reranker_type = "simple"
     
+    def close(self) -> None:
+        """Close the Cohere client, falling back to simple reranking afterwards."""
+        client = getattr(self, "reranker", None)
+        self.reranker = None
+        self.reranker_type = "simple"
+        if client is not None and hasattr(client, "close"):
+            try:
+                client.close()
+            except Exception as e:
+                logger.warning("Failed to close Cohere client: %s", e)
+    
     def rerank(
         self,
         query: str,
@@ -103,7 +114,7 @@ class Reranker:
             return reranked_documents
         
         except Exception as e:
-            logger.error(f"Error during Cohere reranking: {str(e)}")
+            logger.error("Error during Cohere reranking: %s", e)
             # Fall back to simple reranking
             return self._simple_rerank(query, documents, top_k)
     
@@ -201,7 +212,7 @@ class Reranker:
             return reranked_documents
         
         except Exception as e:
-            logger.error(f"Error during simple reranking: {str(e)}")
+            logger.error("Error during simple reranking: %s", e)
             # Return original documents sorted by their original scores
             sorted_documents = sorted(documents, key=lambda x: x.get("score", 0.0), reverse=True)[:top_k]
             return sorted_documents
\ No newline at end of file
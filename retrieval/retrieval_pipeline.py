@@ -29,6 +29,12 @@ class RetrievalPipeline:
         # Create reranker if enabled
         self.reranker = Reranker() if self.config.use_reranking else None
     
+    def close(self) -> None:
+        """Close the vector store and reranker clients."""
+        self.vector_store.close()
+        if self.reranker is not None:
+            self.reranker.close()
+    
     def retrieve(
         self,
         query: str,
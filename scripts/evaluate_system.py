@@ -88,7 +88,7 @@ def load_test_queries(test_file: str) -> List[Dict[str, Any]]:
         return data
         
     except Exception as e:
-        logger.error(f"Error loading test queries: {str(e)}")
+        logger.error("Error loading test queries: %s", e)
         return []
 
 def evaluate_system(
@@ -138,7 +138,7 @@ def evaluate_system(
         expected_door_category = query_obj.get("expected_door_category")
         expected_door_type = query_obj.get("expected_door_type")
         
-        logger.info(f"Evaluating query {i+1}/{len(test_queries)}: {query}")
+        logger.info("Evaluating query %s/%s: %s", i+1, len(test_queries), query)
         
         try:
             # Create a unique session ID for this query
@@ -213,7 +213,7 @@ def evaluate_system(
             metrics["average_response_time"] += query_time
             
         except Exception as e:
-            logger.error(f"Error evaluating query {query}: {str(e)}")
+            logger.error("Error evaluating query %s: %s", query, e)
             results.append({
                 "query": query,
                 "error": str(e),
@@ -254,9 +254,9 @@ def save_results(results: Dict[str, Any], output_file: str, csv_output: Optional
         with open(output_file, 'w') as f:
             json.dump(results, f, indent=2)
         
-        logger.info(f"Saved evaluation results to {output_file}")
+        logger.info("Saved evaluation results to %s", output_file)
     except Exception as e:
-        logger.error(f"Error saving results to {output_file}: {str(e)}")
+        logger.error("Error saving results to %s: %s", output_file, e)
     
     # Save CSV results
     if csv_output:
@@ -300,9 +300,9 @@ def save_results(results: Dict[str, Any], output_file: str, csv_output: Optional
                             f"{evaluation.get('overall', 0):.2f}"
                         ])
             
-            logger.info(f"Saved CSV results to {csv_output}")
+            logger.info("Saved CSV results to %s", csv_output)
         except Exception as e:
-            logger.error(f"Error saving CSV results to {csv_output}: {str(e)}")
+            logger.error("Error saving CSV results to %s: %s", csv_output, e)
 
 def print_results_summary(results: Dict[str, Any], verbose: bool = False):
     """
@@ -356,7 +356,7 @@ def main():
     """Main entry point."""
     args = parse_arguments()
     
-    logger.info(f"Starting system evaluation with test file: {args.test_file}")
+    logger.info("Starting system evaluation with test file: %s", args.test_file)
     
     # Load test queries
     test_queries = load_test_queries(args.test_file)
@@ -365,7 +365,7 @@ def main():
         logger.error("No test queries found")
         return
     
-    logger.info(f"Loaded {len(test_queries)} test queries")
+    logger.info("Loaded %s test queries", len(test_queries))
     
     # Evaluate system
     results = evaluate_system(
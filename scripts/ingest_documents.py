@@ -10,12 +10,15 @@ import os
 import argparse
 import logging
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import time
 from tqdm import tqdm
 
 from door_installation_assistant.config.app_config import get_config
-from door_installation_assistant.data_processing.document_processor import process_document
+from door_installation_assistant.data_processing.document_processor import (
+    create_document_pool,
+    process_documents_batch,
+)
 from door_installation_assistant.vector_storage.qdrant_store import QdrantStore
 from door_installation_assistant.utils.file_utils import list_files_by_extension, get_file_size_human_readable
 from door_installation_assistant.utils.logging_utils import setup_logger
@@ -42,6 +45,12 @@ def parse_arguments():
         default=10, 
         help="Number of documents to process in a batch"
     )
+    parser.add_argument(
+        "--workers", 
+        type=int, 
+        default=None, 
+        help="Number of worker processes parsing documents (default: 4, or fewer CPUs)"
+    )
     parser.add_argument(
         "--skip-existing", 
         action="store_true", 
@@ -75,7 +84,7 @@ def find_documents(input_dir: str, file_type: str, recursive: bool) -> List[Path
     input_path = Path(input_dir)
     
     if not input_path.exists() or not input_path.is_dir():
-        logger.error(f"Input directory {input_dir} does not exist or is not a directory")
+        logger.error("Input directory %s does not exist or is not a directory", input_dir)
         return []
     
     if recursive:
@@ -85,14 +94,24 @@ def find_documents(input_dir: str, file_type: str, recursive: bool) -> List[Path
         # Use list_files_by_extension utility
         return list_files_by_extension(input_dir, file_type)
 
-def process_documents(file_paths: List[Path], batch_size: int, skip_existing: bool) -> Dict[str, Any]:
+def process_documents(
+    file_paths: List[Path],
+    batch_size: int,
+    skip_existing: bool,
+    workers: Optional[int] = None
+) -> Dict[str, Any]:
     """
     Process documents and add them to the vector store.
     
+    The documents in each batch are parsed in parallel by one worker pool
+    shared across batches, and their chunks embedded together, then added to
+    the vector store.
+    
     Args:
         file_paths: List of document file paths
         batch_size: Number of documents to process in a batch
         skip_existing: Whether to skip documents that have already been ingested
+        workers: Number of worker processes (defaults to 4, or fewer CPUs)
         
     Returns:
         Dictionary with processing results
@@ -121,46 +140,74 @@ def process_documents(file_paths: List[Path], batch_size: int, skip_existing: bo
                 if "file_path" in doc.get("metadata", {}):
                     existing_docs.add(doc["metadata"]["file_path"])
             
-            logger.info(f"Found {len(existing_docs)} existing documents in vector store")
+            logger.info("Found %s existing documents in vector store", len(existing_docs))
         except Exception as e:
-            logger.warning(f"Error getting existing documents: {str(e)}")
+            logger.warning("Error getting existing documents: %s", e)
     
-    # Process documents in batches
-    for i in range(0, len(file_paths), batch_size):
-        batch = file_paths[i:i+batch_size]
-        
-        for file_path in tqdm(batch, desc=f"Processing batch {i//batch_size + 1}/{(len(file_paths) + batch_size - 1)//batch_size}"):
-            try:
+    # Documents whose parsing raised, collected per batch
+    parse_failures = set()
+    
+    def on_parsed(file_path: str, error: Optional[Exception]) -> None:
+        progress.update(1)
+        if error is not None:
+            parse_failures.add(file_path)
+    
+    # One worker pool serves every batch, so workers start and load the
+    # partitioning stack once per run
+    num_batches = (len(file_paths) + batch_size - 1) // batch_size
+    with create_document_pool(workers) as pool, tqdm(total=len(file_paths), desc="Processing documents") as progress:
+        for i in range(0, len(file_paths), batch_size):
+            progress.set_postfix_str(f"batch {i//batch_size + 1}/{num_batches}")
+            batch = []
+            for file_path in file_paths[i:i+batch_size]:
                 # Check if document already exists
                 if skip_existing and str(file_path) in existing_docs:
-                    logger.info(f"Skipping existing document: {file_path}")
+                    logger.info("Skipping existing document: %s", file_path)
                     results["skipped"] += 1
+                    progress.update(1)
                     continue
                 
-                # Get file size for logging
-                file_size = get_file_size_human_readable(file_path)
-                logger.info(f"Processing document: {file_path} ({file_size})")
-                
-                # Process document into chunks
-                start_time = time.time()
-                chunks = process_document(file_path)
-                processing_time = time.time() - start_time
-                logger.info(f"Processed {file_path} into {len(chunks)} chunks in {processing_time:.2f} seconds")
-                
-                # Add chunks to vector store
-                start_time = time.time()
-                document_ids = vector_store.add_documents(chunks)
-                indexing_time = time.time() - start_time
-                logger.info(f"Added {len(document_ids)} chunks to vector store in {indexing_time:.2f} seconds")
-                
-                # Update results
-                results["processed"] += 1
-                results["chunks_added"] += len(document_ids)
-                results["document_ids"].extend(document_ids)
+                try:
+                    # Get file size for logging
+                    file_size = get_file_size_human_readable(file_path)
+                    logger.info("Processing document: %s (%s)", file_path, file_size)
+                    batch.append(str(file_path))
+                except Exception as e:
+                    logger.error("Error processing %s: %s", file_path, e)
+                    results["failed"] += 1
+                    progress.update(1)
+            
+            if not batch:
+                continue
+            
+            # Parse the batch's documents in parallel worker processes
+            parse_failures.clear()
+            start_time = time.time()
+            batch_chunks = process_documents_batch(batch, executor=pool, on_result=on_parsed)
+            processing_time = time.time() - start_time
+            logger.info("Processed %s documents in %.2f seconds", len(batch), processing_time)
+            
+            for file_path, chunks in batch_chunks.items():
+                # The parse error has already been logged by process_documents_batch
+                if file_path in parse_failures:
+                    results["failed"] += 1
+                    continue
                 
-            except Exception as e:
-                logger.error(f"Error processing {file_path}: {str(e)}")
-                results["failed"] += 1
+                try:
+                    # Add chunks to vector store
+                    start_time = time.time()
+                    document_ids = vector_store.add_documents(chunks)
+                    indexing_time = time.time() - start_time
+                    logger.info("Added %s chunks to vector store in %.2f seconds", len(document_ids), indexing_time)
+                    
+                    # Update results
+                    results["processed"] += 1
+                    results["chunks_added"] += len(document_ids)
+                    results["document_ids"].extend(document_ids)
+                    
+                except Exception as e:
+                    logger.error("Error processing %s: %s", file_path, e)
+                    results["failed"] += 1
     
     return results
 
@@ -168,7 +215,7 @@ def main():
     """Main entry point."""
     args = parse_arguments()
     
-    logger.info(f"Starting document ingestion from {args.input_dir}")
+    logger.info("Starting document ingestion from %s", args.input_dir)
     start_time = time.time()
     
     # Clear existing vector store if requested
@@ -182,22 +229,22 @@ def main():
     
     # Find documents to process
     file_paths = find_documents(args.input_dir, args.file_type, args.recursive)
-    logger.info(f"Found {len(file_paths)} {args.file_type} files to process")
+    logger.info("Found %s %s files to process", len(file_paths), args.file_type)
     
     if not file_paths:
-        logger.warning(f"No {args.file_type} files found in {args.input_dir}")
+        logger.warning("No %s files found in %s", args.file_type, args.input_dir)
         return
     
     # Process documents
-    results = process_documents(file_paths, args.batch_size, args.skip_existing)
+    results = process_documents(file_paths, args.batch_size, args.skip_existing, args.workers)
     
     # Log results
     total_time = time.time() - start_time
-    logger.info(f"Document ingestion complete in {total_time:.2f} seconds")
-    logger.info(f"Processed: {results['processed']}")
-    logger.info(f"Failed: {results['failed']}")
-    logger.info(f"Skipped: {results['skipped']}")
-    logger.info(f"Total chunks added: {results['chunks_added']}")
+    logger.info("Document ingestion complete in %.2f seconds", total_time)
+    logger.info("Processed: %s", results['processed'])
+    logger.info("Failed: %s", results['failed'])
+    logger.info("Skipped: %s", results['skipped'])
+    logger.info("Total chunks added: %s", results['chunks_added'])
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -103,11 +103,11 @@ def setup_qdrant(args) -> bool:
         
         # If recreate flag is set, delete existing collection
         if args.recreate:
-            logger.info(f"Recreating collection {args.collection}")
+            logger.info("Recreating collection %s", args.collection)
             try:
                 vector_store.delete_collection()
             except Exception as e:
-                logger.warning(f"Error deleting collection: {str(e)}")
+                logger.warning("Error deleting collection: %s", e)
         
         # Initialize Qdrant
         success = vector_store.initialize()
@@ -117,7 +117,7 @@ def setup_qdrant(args) -> bool:
             
             # Count existing vectors
             vector_count = vector_store.count_documents()
-            logger.info(f"Collection contains {vector_count} vectors")
+            logger.info("Collection contains %s vectors", vector_count)
             
             return True
         else:
@@ -125,7 +125,7 @@ def setup_qdrant(args) -> bool:
             return False
             
     except Exception as e:
-        logger.error(f"Error setting up Qdrant: {str(e)}")
+        logger.error("Error setting up Qdrant: %s", e)
         return False
 
 def setup_vector_store(args) -> bool:
@@ -147,7 +147,7 @@ def setup_vector_store(args) -> bool:
         logger.error("Weaviate provider not implemented yet")
         return False
     else:
-        logger.error(f"Unknown vector store provider: {args.provider}")
+        logger.error("Unknown vector store provider: %s", args.provider)
         return False
 
 def update_configuration(args, config: Optional[AppConfig] = None) -> bool:
@@ -184,11 +184,11 @@ def update_configuration(args, config: Optional[AppConfig] = None) -> bool:
             if args.api_key:
                 f.write(f"VECTOR_STORE_API_KEY={args.api_key}\n")
         
-        logger.info(f"Updated configuration in {env_path}")
+        logger.info("Updated configuration in %s", env_path)
         return True
         
     except Exception as e:
-        logger.error(f"Error updating configuration: {str(e)}")
+        logger.error("Error updating configuration: %s", e)
         return False
 
 def get_timestamp() -> str:
@@ -200,7 +200,7 @@ def main():
     """Main entry point."""
     args = parse_arguments()
     
-    logger.info(f"Setting up {args.provider} vector store")
+    logger.info("Setting up %s vector store", args.provider)
     
     # Set up vector store
     success = setup_vector_store(args)
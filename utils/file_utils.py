@@ -96,7 +96,7 @@ def save_uploaded_file(uploaded_file: BinaryIO, directory: Union[str, Path], fil
         # Handle string path (copy file)
         shutil.copy2(uploaded_file, file_path)
     
-    logger.info(f"Saved uploaded file to {file_path}")
+    logger.info("Saved uploaded file to %s", file_path)
     return file_path
 
 def list_files_by_extension(directory: Union[str, Path], extension: str) -> List[Path]:
@@ -113,7 +113,7 @@ def list_files_by_extension(directory: Union[str, Path], extension: str) -> List
     dir_path = Path(directory)
     
     if not dir_path.exists() or not dir_path.is_dir():
-        logger.warning(f"Directory {directory} does not exist or is not a directory")
+        logger.warning("Directory %s does not exist or is not a directory", directory)
         return []
     
     # Normalize extension format
@@ -179,9 +179,9 @@ def delete_file(file_path: Union[str, Path]) -> bool:
         path = Path(file_path)
         if path.exists():
             path.unlink()
-            logger.info(f"Deleted file {file_path}")
+            logger.info("Deleted file %s", file_path)
             return True
         return False
     except Exception as e:
-        logger.error(f"Error deleting file {file_path}: {str(e)}")
+        logger.error("Error deleting file %s: %s", file_path, e)
         return False
\ No newline at end of file
@@ -101,7 +101,7 @@ def log_function_call(logger: logging.Logger, level: int = logging.DEBUG):
                 logger.log(level, f"{func.__name__} returned: {result}")
                 return result
             except Exception as e:
-                logger.exception(f"Exception in {func.__name__}: {str(e)}")
+                logger.exception("Exception in %s: %s", func.__name__, e)
                 raise
         return wrapper
     return decorator
@@ -190,5 +190,5 @@ def configure_async_logging(base_dir: Union[str, Path] = "logs") -> logging.Logg
     logging.getLogger("aiohttp").setLevel(logging.WARNING)
     logging.getLogger("asyncio").setLevel(logging.WARNING)
     
-    logger.info(f"Logging configured in directory: {log_dir}")
+    logger.info("Logging configured in directory: %s", log_dir)
     return logger
\ No newline at end of file
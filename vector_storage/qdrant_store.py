@@ -45,15 +45,18 @@ class QdrantStore(VectorStore):
             collection_names = [collection.name for collection in collections]
             
             if self.collection_name not in collection_names:
-                logger.info(f"Creating collection '{self.collection_name}'")
+                logger.info("Creating collection '%s'", self.collection_name)
                 self._create_collection()
             else:
                 # Verify collection is ready
                 collection_info = self.client.get_collection(self.collection_name)
                 if collection_info.status != CollectionStatus.GREEN:
-                    logger.warning(f"Collection '{self.collection_name}' is not ready (status: {collection_info.status})")
+                    logger.warning(
+                        "Collection '%s' is not ready (status: %s)",
+                        self.collection_name, collection_info.status
+                    )
                 else:
-                    logger.info(f"Collection '{self.collection_name}' is ready")
+                    logger.info("Collection '%s' is ready", self.collection_name)
             
             # Create payload indexes for efficient filtering
             self._create_payload_indexes()
@@ -61,9 +64,34 @@ class QdrantStore(VectorStore):
             return True
         
         except Exception as e:
-            logger.error(f"Failed to initialize Qdrant: {str(e)}")
+            logger.error("Failed to initialize Qdrant: %s", e)
             return False
     
+    def close(self) -> None:
+        """Close the Qdrant client's connections; the store can be initialized again later."""
+        client, self.client = self.client, None
+        if client is not None and hasattr(client, "close"):
+            try:
+                client.close()
+            except Exception as e:
+                logger.warning("Failed to close Qdrant client: %s", e)
+    
+    def _quantization_config(self) -> Optional[models.ScalarQuantization]:
+        """Get the quantization settings for a new collection from config."""
+        quantization = getattr(self.config, "quantization", "none").lower()
+        if quantization == "int8":
+            # Keep int8 copies in RAM for search; full vectors rescore the top hits
+            return models.ScalarQuantization(
+                scalar=models.ScalarQuantizationConfig(
+                    type=models.ScalarType.INT8,
+                    quantile=0.99,
+                    always_ram=True
+                )
+            )
+        if quantization != "none":
+            logger.warning("Unsupported vector quantization: %s. Storing full vectors only.", quantization)
+        return None
+    
     def _create_collection(self):
         """Create a new collection in Qdrant."""
         try:
@@ -75,13 +103,14 @@ class QdrantStore(VectorStore):
                 ),
                 optimizers_config=models.OptimizersConfigDiff(
                     indexing_threshold=10000  # Start indexing after this many vectors
-                )
+                ),
+                quantization_config=self._quantization_config()
             )
-            logger.info(f"Created collection '{self.collection_name}'")
+            logger.info("Created collection '%s'", self.collection_name)
             return True
         
         except Exception as e:
-            logger.error(f"Failed to create collection: {str(e)}")
+            logger.error("Failed to create collection: %s", e)
             return False
     
     def _create_payload_indexes(self):
@@ -105,17 +134,17 @@ class QdrantStore(VectorStore):
                         field_name=field_name,
                         field_schema=field_schema
                     )
-                    logger.info(f"Created payload index for field '{field_name}' ({field_type})")
+                    logger.info("Created payload index for field '%s' (%s)", field_name, field_type)
                 
                 except Exception as e:
                     # Index might already exist, which is fine
                     if "already exists" not in str(e).lower():
-                        logger.warning(f"Failed to create payload index for field '{field_name}': {str(e)}")
+                        logger.warning("Failed to create payload index for field '%s': %s", field_name, e)
             
             return True
         
         except Exception as e:
-            logger.error(f"Failed to create payload indexes: {str(e)}")
+            logger.error("Failed to create payload indexes: %s", e)
             return False
     
     def _convert_metadata_for_qdrant(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
@@ -150,7 +179,7 @@ class QdrantStore(VectorStore):
                 if embedding is None:
                     text = doc.get("text", "")
                     if not text:
-                        logger.warning(f"Document has no text content, skipping: {doc}")
+                        logger.warning("Document has no text content, skipping: %s", doc)
                         continue
                     embedding = self.embedding_generator.generate_embedding(text)
                 
@@ -179,12 +208,12 @@ class QdrantStore(VectorStore):
                         collection_name=self.collection_name,
                         points=batch_points
                     )
-                    logger.info(f"Added batch of {len(batch_points)} documents to collection")
+                    logger.info("Added batch of %s documents to collection", len(batch_points))
             
             return document_ids
         
         except Exception as e:
-            logger.error(f"Failed to add documents: {str(e)}")
+            logger.error("Failed to add documents: %s", e)
             return []
     
     def _create_filter_from_dict(self, filter_dict: Dict[str, Any]) -> Optional[Filter]:
@@ -338,7 +367,7 @@ class QdrantStore(VectorStore):
             return results
         
         except Exception as e:
-            logger.error(f"Failed to perform hybrid search: {str(e)}")
+            logger.error("Failed to perform hybrid search: %s", e)
             return []
     
     def delete_documents(self, document_ids: List[str]) -> None:
@@ -354,19 +383,19 @@ class QdrantStore(VectorStore):
                         points=batch_ids
                     )
                 )
-                logger.info(f"Deleted batch of {len(batch_ids)} documents from collection")
+                logger.info("Deleted batch of %s documents from collection", len(batch_ids))
         
         except Exception as e:
-            logger.error(f"Failed to delete documents: {str(e)}")
+            logger.error("Failed to delete documents: %s", e)
     
     def delete_collection(self) -> None:
         """Delete the entire collection."""
         try:
             self.client.delete_collection(collection_name=self.collection_name)
-            logger.info(f"Deleted collection '{self.collection_name}'")
+            logger.info("Deleted collection '%s'", self.collection_name)
         
         except Exception as e:
-            logger.error(f"Failed to delete collection: {str(e)}")
+            logger.error("Failed to delete collection: %s", e)
     
     def get_document(self, document_id: str) -> Optional[Dict[str, Any]]:
         """Get a document by ID."""
@@ -396,7 +425,7 @@ class QdrantStore(VectorStore):
             return document
         
         except Exception as e:
-            logger.error(f"Failed to get document: {str(e)}")
+            logger.error("Failed to get document: %s", e)
             return None
     
     def update_document(self, document_id: str, document: Dict[str, Any]) -> None:
@@ -407,7 +436,7 @@ class QdrantStore(VectorStore):
             if embedding is None:
                 text = document.get("text", "")
                 if not text:
-                    logger.warning(f"Document has no text content, cannot update: {document}")
+                    logger.warning("Document has no text content, cannot update: %s", document)
                     return
                 embedding = self.embedding_generator.generate_embedding(text)
             
@@ -430,10 +459,10 @@ class QdrantStore(VectorStore):
                 collection_name=self.collection_name,
                 points=[point]
             )
-            logger.info(f"Updated document {document_id}")
+            logger.info("Updated document %s", document_id)
         
         except Exception as e:
-            logger.error(f"Failed to update document: {str(e)}")
+            logger.error("Failed to update document: %s", e)
     
     def count_documents(self) -> int:
         """Count the number of documents in the vector store."""
@@ -442,7 +471,7 @@ class QdrantStore(VectorStore):
             return collection_info.vectors_count
         
         except Exception as e:
-            logger.error(f"Failed to count documents: {str(e)}")
+            logger.error("Failed to count documents: %s", e)
             return 0
     
     def get_all_documents(self, batch_size: int = 100) -> List[Dict[str, Any]]:
@@ -487,7 +516,7 @@ class QdrantStore(VectorStore):
             return documents
         
         except Exception as e:
-            logger.error(f"Failed to get all documents: {str(e)}")
+            logger.error("Failed to get all documents: %s", e)
             return []
     
     def similarity_search(
@@ -536,7 +565,7 @@ class QdrantStore(VectorStore):
             return results
         
         except Exception as e:
-            logger.error(f"Failed to perform similarity search: {str(e)}")
+            logger.error("Failed to perform similarity search: %s", e)
             return []
     
     def keyword_search(
@@ -617,5 +646,5 @@ class QdrantStore(VectorStore):
             return results
         
         except Exception as e:
-            logger.error(f"Failed to perform keyword search: {str(e)}")
+            logger.error("Failed to perform keyword search: %s", e)
             return []
\ No newline at end of file